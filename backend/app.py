@@ -1464,7 +1464,7 @@ async def ingest_protobuf_data(
     
     Args:
         schema_id: ID of the registered schema to use for decoding
-        pb_file: Binary protobuf file containing encoded messages (one per line)
+        pb_file: Binary protobuf file containing length-delimited encoded messages
         target_engine: Target database engine (duckdb or clickhouse)
         batch_size: Number of records to insert in each batch
         create_table_if_not_exists: Whether to create table if it doesn't exist
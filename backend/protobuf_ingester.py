@@ -7,18 +7,21 @@ and bulk ingestion into DuckDB/ClickHouse databases.
 """
 
 import os
-import json
+import mmap
 import tempfile
 import subprocess
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple, Iterator
+from typing import Callable, Dict, List, Any, Optional, Tuple, Iterator, Union
 from pathlib import Path
 import logging
 
+import orjson
+import pyarrow as pa
 import google.protobuf.message
 from google.protobuf.descriptor import Descriptor
 from google.protobuf.json_format import MessageToDict
 from google.protobuf import message
+from google.protobuf.internal.decoder import _DecodeVarint32
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -35,6 +38,33 @@ class ProtobufIngestionError(Exception):
     pass
 
 
+def _to_integer(value: Any) -> Any:
+    return int(value) if isinstance(value, (int, float, str)) else value
+
+
+def _to_float(value: Any) -> Any:
+    return float(value) if isinstance(value, (int, float, str)) else value
+
+
+def _to_timestamp(value: Any) -> Any:
+    if isinstance(value, str):
+        return value
+    elif isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value).isoformat()
+    else:
+        return str(value)
+
+
+def _to_json_record(value: Any) -> str:
+    # For nested records, convert to JSON string
+    return orjson.dumps(value).decode() if isinstance(value, dict) else str(value)
+
+
+def _to_json_array(value: Any) -> str:
+    # For repeated fields, convert to JSON array
+    return orjson.dumps(value).decode() if isinstance(value, list) else str(value)
+
+
 class ProtobufIngester:
     """
     Handles protobuf data decoding and database ingestion.
@@ -54,6 +84,19 @@ class ProtobufIngester:
             protoc_path: Path to protoc binary (default: "protoc" from PATH)
         """
         self.protoc_path = protoc_path
+        
+        # BigQuery field type -> converter, resolved once per field rather
+        # than string-compared for every value
+        self._field_converters: Dict[str, Callable[[Any], Any]] = {
+            'STRING': str,
+            'INTEGER': _to_integer,
+            'FLOAT': _to_float,
+            'BOOLEAN': bool,
+            'TIMESTAMP': _to_timestamp,
+            'RECORD': _to_json_record,
+            'REPEATED': _to_json_array,
+        }
+        
         self._validate_protoc_installation()
     
     def _validate_protoc_installation(self) -> None:
@@ -188,13 +231,15 @@ class ProtobufIngester:
     
     def decode_protobuf_messages(self, 
                                 proto_content: str,
-                                pb_data: bytes) -> List[Dict[str, Any]]:
+                                pb_data: Union[bytes, memoryview, mmap.mmap]) -> List[Dict[str, Any]]:
         """
         Decode protobuf messages from binary data using schema
         
         Args:
             proto_content: Content of the .proto file
-            pb_data: Binary protobuf data (one message per line)
+            pb_data: Binary protobuf data as a length-delimited stream
+                     (each message prefixed with its varint-encoded size);
+                     any bytes-like object, sliced without copying
             
         Returns:
             List of decoded message dictionaries
@@ -209,33 +254,54 @@ class ProtobufIngester:
             # Load protobuf message class
             message_class = self._load_protobuf_class(python_module_path, message_class_name)
             
-            # Decode messages (assuming one message per line)
+            # Decode length-delimited messages (varint size prefix per message),
+            # slicing a memoryview so message bytes are never copied
             decoded_messages = []
-            lines = pb_data.split(b'\n')
+            data = memoryview(pb_data)
+            message_bytes = None
+            pos = 0
+            line_num = 0
             
-            for line_num, line in enumerate(lines, 1):
-                if not line.strip():  # Skip empty lines
-                    continue
-                
-                try:
-                    # Create message instance and parse binary data
-                    message_instance = message_class()
-                    message_instance.ParseFromString(line.strip())
+            try:
+                while pos < len(data):
+                    line_num += 1
                     
-                    # Convert to dictionary using MessageToDict for better handling
-                    # of repeated fields and nested messages
-                    message_dict = MessageToDict(message_instance)
+                    try:
+                        size, pos = _DecodeVarint32(data, pos)
+                    except Exception as e:
+                        raise ProtobufDecodingError(f"Invalid message size prefix at message {line_num}: {e}")
                     
-                    # Add metadata
-                    message_dict['_line_number'] = line_num
-                    message_dict['_ingestion_timestamp'] = datetime.now().isoformat()
+                    message_bytes = data[pos:pos + size]
+                    pos += size
                     
-                    decoded_messages.append(message_dict)
+                    if len(message_bytes) != size:
+                        logger.warning(f"Truncated message at message {line_num}: expected {size} bytes, got {len(message_bytes)}")
+                        break
                     
-                except Exception as e:
-                    logger.warning(f"Failed to decode message at line {line_num}: {e}")
-                    # Continue processing other messages
-                    continue
+                    try:
+                        # Create message instance and parse binary data
+                        message_instance = message_class()
+                        message_instance.ParseFromString(message_bytes)
+                        
+                        # Convert to dictionary using MessageToDict for better handling
+                        # of repeated fields and nested messages
+                        message_dict = MessageToDict(message_instance, preserving_proto_field_name=True)
+                        
+                        # Add metadata
+                        message_dict['_line_number'] = line_num
+                        message_dict['_ingestion_timestamp'] = datetime.now().isoformat()
+                        
+                        decoded_messages.append(message_dict)
+                        
+                    except Exception as e:
+                        logger.warning(f"Failed to decode message {line_num}: {e}")
+                        # Continue processing other messages
+                        continue
+            finally:
+                # Drop buffer references so a backing mmap can be closed
+                if message_bytes is not None:
+                    message_bytes.release()
+                data.release()
             
             logger.info(f"Successfully decoded {len(decoded_messages)} protobuf messages")
             return decoded_messages
@@ -243,6 +309,29 @@ class ProtobufIngester:
         except Exception as e:
             raise ProtobufDecodingError(f"Failed to decode protobuf messages: {e}")
     
+    def decode_protobuf_file(self,
+                             proto_content: str,
+                             pb_path: Union[str, Path]) -> List[Dict[str, Any]]:
+        """
+        Decode a length-delimited protobuf file by memory-mapping it
+        
+        Args:
+            proto_content: Content of the .proto file
+            pb_path: Path to the binary protobuf file
+            
+        Returns:
+            List of decoded message dictionaries
+            
+        Raises:
+            ProtobufDecodingError: If decoding fails
+        """
+        with open(pb_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return []
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as pb_map:
+                return self.decode_protobuf_messages(proto_content, pb_map)
+    
     def prepare_records_for_insertion(self,
                                     decoded_messages: List[Dict[str, Any]],
                                     schema_fields: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -263,14 +352,20 @@ class ProtobufIngester:
         for field in schema_fields:
             field_types[field['name']] = field['type']
         
+        # Specialize a converter per field once for the whole batch
+        field_converters = [
+            (field_name, field_type, self._field_converters.get(field_type, str))
+            for field_name, field_type in field_types.items()
+        ]
+        
         for message in decoded_messages:
             prepared_record = {}
             
             # Convert each field according to schema
-            for field_name, field_type in field_types.items():
+            for field_name, field_type, convert in field_converters:
                 if field_name in message:
                     value = message[field_name]
-                    prepared_record[field_name] = self._convert_field_value(value, field_type)
+                    prepared_record[field_name] = None if value is None else convert(value)
                 else:
                     # Handle missing fields with defaults
                     prepared_record[field_name] = self._get_default_value(field_type)
@@ -297,32 +392,8 @@ class ProtobufIngester:
         if value is None:
             return None
         
-        # Handle different BigQuery field types
-        if field_type == 'STRING':
-            return str(value)
-        elif field_type == 'INTEGER':
-            return int(value) if isinstance(value, (int, float, str)) else value
-        elif field_type == 'FLOAT':
-            return float(value) if isinstance(value, (int, float, str)) else value
-        elif field_type == 'BOOLEAN':
-            return bool(value)
-        elif field_type == 'TIMESTAMP':
-            # Handle timestamp conversion
-            if isinstance(value, str):
-                return value
-            elif isinstance(value, (int, float)):
-                return datetime.fromtimestamp(value).isoformat()
-            else:
-                return str(value)
-        elif field_type == 'RECORD':
-            # For nested records, convert to JSON string
-            return json.dumps(value) if isinstance(value, dict) else str(value)
-        elif field_type == 'REPEATED':
-            # For repeated fields, convert to JSON array
-            return json.dumps(value) if isinstance(value, list) else str(value)
-        else:
-            # Default: convert to string
-            return str(value)
+        # Dispatch on BigQuery field type; unknown types convert to string
+        return self._field_converters.get(field_type, str)(value)
     
     def _get_default_value(self, field_type: str) -> Any:
         """
@@ -375,6 +446,16 @@ class ProtobufIngester:
             batch = prepared_records[i:i + batch_size]
             
             try:
+                connection = getattr(engine_runner, "connection", None)
+                
+                if hasattr(connection, "register"):
+                    # Embedded engine (DuckDB): register the batch as an Arrow table and INSERT ... SELECT from it
+                    inserted_count += self._bulk_append(
+                        batch, table_name, database_name, connection
+                    )
+                    logger.info(f"Appended batch {i//batch_size + 1} with {len(batch)} records")
+                    continue
+                
                 # Generate INSERT SQL for batch
                 insert_sql = self._generate_bulk_insert_sql(
                     batch, table_name, database_name
@@ -396,6 +477,47 @@ class ProtobufIngester:
         
         return inserted_count, errors
     
+    def _bulk_append(self,
+                     records: List[Dict[str, Any]],
+                     table_name: str,
+                     database_name: str,
+                     connection) -> int:
+        """
+        Append records to a DuckDB table via a registered Arrow table
+        
+        Avoids building and re-parsing a textual VALUES list: the batch is
+        handed to DuckDB as a columnar Arrow table and inserted with a single
+        INSERT ... SELECT. Arrow keeps integer columns with NULLs as nullable
+        int64 (pandas would widen them to float64 and lose precision above 2**53).
+        
+        Args:
+            records: List of records to insert
+            table_name: Target table name
+            database_name: Target database name
+            connection: DuckDB connection
+            
+        Returns:
+            Number of records appended
+        """
+        if not records:
+            return 0
+        
+        # Get column names from first record
+        columns = list(records[0].keys())
+        column_names = ', '.join([f'"{col}"' for col in columns])
+        
+        batch_table = pa.Table.from_pylist(records)
+        connection.register("_ingest_batch", batch_table)
+        try:
+            connection.execute(f"""
+                INSERT INTO {database_name}.{table_name} ({column_names})
+                SELECT {column_names} FROM _ingest_batch
+            """)
+        finally:
+            connection.unregister("_ingest_batch")
+        
+        return len(records)
+    
     def _generate_bulk_insert_sql(self,
                                 records: List[Dict[str, Any]],
                                 table_name: str,
@@ -80,7 +80,8 @@ def run_tests_with_coverage():
         "-v",
         "--cov=runners",
         "--cov-report=term-missing",
-        "--cov-report=html:htmlcov"
+        "--cov-report=html:htmlcov",
+        "--cov-fail-under=80"
     ], "Running tests with coverage")
 
 
@@ -9,10 +9,17 @@ Provides BigQuery-like functionality with distributed query execution.
 import time
 import asyncio
 import re
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
 import clickhouse_connect
 from clickhouse_connect.driver.exceptions import ClickHouseError
 
+# Patterns used by the validation helpers, compiled once at import
+_QUERY_TYPE_RE = re.compile(r'\s*(SELECT|INSERT|UPDATE|DELETE|CREATE|DROP|ALTER|WITH)', re.IGNORECASE)
+_FROM_JOIN_RE = re.compile(r'\b(?:FROM|JOIN)\s+([a-zA-Z_][a-zA-Z0-9_]*)', re.IGNORECASE)
+_INSERT_INTO_RE = re.compile(r'\bINSERT\s+INTO\s+([a-zA-Z_][a-zA-Z0-9_]*)', re.IGNORECASE)
+_UPDATE_RE = re.compile(r'\bUPDATE\s+([a-zA-Z_][a-zA-Z0-9_]*)', re.IGNORECASE)
+
 
 class ClickHouseRunner:
     """ClickHouse query execution engine"""
@@ -158,7 +165,7 @@ class ClickHouseRunner:
         if not self.is_initialized:
             raise Exception("ClickHouse is not available")
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Ensure we're using the correct database
@@ -170,7 +177,8 @@ class ClickHouseRunner:
             # Execute the query
             result = self.client.query(cleaned_sql)
             
-            execution_time = time.time() - start_time
+            execution_time_ns = time.perf_counter_ns() - start_ns
+            execution_time = execution_time_ns / 1e9
             
             # Convert result to list of dictionaries
             if result.result_rows:
@@ -212,11 +220,13 @@ class ClickHouseRunner:
             return {
                 "data": data,
                 "execution_time": execution_time,
+                "execution_time_ns": execution_time_ns,
                 "rows": row_count,
                 "engine": "clickhouse",
                 "query_plan": query_plan,
                 "performance_metrics": {
                     "execution_time": execution_time,
+                    "execution_time_ns": execution_time_ns,
                     "memory_used_mb": estimated_memory,
                     "rows_processed": row_count,
                     "engine": "clickhouse",
@@ -227,22 +237,26 @@ class ClickHouseRunner:
             }
             
         except ClickHouseError as e:
-            execution_time = time.time() - start_time
+            execution_time_ns = time.perf_counter_ns() - start_ns
+            execution_time = execution_time_ns / 1e9
             
             return {
                 "data": [],
                 "execution_time": execution_time,
+                "execution_time_ns": execution_time_ns,
                 "rows": 0,
                 "engine": "clickhouse",
                 "error": str(e),
                 "query_plan": f"Error executing query: {str(e)}"
             }
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time_ns = time.perf_counter_ns() - start_ns
+            execution_time = execution_time_ns / 1e9
             
             return {
                 "data": [],
                 "execution_time": execution_time,
+                "execution_time_ns": execution_time_ns,
                 "rows": 0,
                 "engine": "clickhouse",
                 "error": str(e),
@@ -485,26 +499,8 @@ class ClickHouseRunner:
     
     def _get_query_type(self, sql: str) -> str:
         """Determine the type of SQL query"""
-        sql_upper = sql.upper().strip()
-        
-        if sql_upper.startswith('SELECT'):
-            return "SELECT"
-        elif sql_upper.startswith('INSERT'):
-            return "INSERT"
-        elif sql_upper.startswith('UPDATE'):
-            return "UPDATE"
-        elif sql_upper.startswith('DELETE'):
-            return "DELETE"
-        elif sql_upper.startswith('CREATE'):
-            return "CREATE"
-        elif sql_upper.startswith('DROP'):
-            return "DROP"
-        elif sql_upper.startswith('ALTER'):
-            return "ALTER"
-        elif sql_upper.startswith('WITH'):
-            return "WITH"
-        else:
-            return "OTHER"
+        match = _QUERY_TYPE_RE.match(sql)
+        return match.group(1).upper() if match else "OTHER"
     
     def _extract_table_names(self, sql: str) -> List[str]:
         """Extract table names from SQL query"""
@@ -512,23 +508,18 @@ class ClickHouseRunner:
         tables = set()
         
         # Look for patterns like "FROM table_name" and "JOIN table_name"
-        from_pattern = r'\b(?:FROM|JOIN)\s+([a-zA-Z_][a-zA-Z0-9_]*)'
-        matches = re.findall(from_pattern, sql, re.IGNORECASE)
-        tables.update(matches)
+        tables.update(_FROM_JOIN_RE.findall(sql))
         
         # Look for table names after INSERT INTO, UPDATE, etc.
-        insert_pattern = r'\bINSERT\s+INTO\s+([a-zA-Z_][a-zA-Z0-9_]*)'
-        matches = re.findall(insert_pattern, sql, re.IGNORECASE)
-        tables.update(matches)
-        
-        update_pattern = r'\bUPDATE\s+([a-zA-Z_][a-zA-Z0-9_]*)'
-        matches = re.findall(update_pattern, sql, re.IGNORECASE)
-        tables.update(matches)
+        tables.update(_INSERT_INTO_RE.findall(sql))
+        tables.update(_UPDATE_RE.findall(sql))
         
         return list(tables)
     
-    def _estimate_execution_time(self, sql: str, estimated_rows: int, query_type: str) -> int:
-        """Estimate query execution time in milliseconds"""
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _estimate_execution_time(sql: str, estimated_rows: int, query_type: str) -> int:
+        """Estimate query execution time in milliseconds (pure, so cached per input)"""
         base_time = 20  # Base overhead (higher for distributed system)
         
         # Factor in data size
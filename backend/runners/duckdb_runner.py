@@ -97,7 +97,7 @@ class DuckDBRunner:
         if not self.is_initialized:
             await self.initialize()
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             # Clear previous profiling data
@@ -106,11 +106,14 @@ class DuckDBRunner:
             # Execute the query
             result = self.connection.execute(sql).fetchdf()
             
-            execution_time = time.time() - start_time
+            execution_time_ns = time.perf_counter_ns() - start_ns
+            execution_time = execution_time_ns / 1e9
             
-            # Get query plan (simplified version)
+            # Get query plan (simplified version); EXPLAIN ANALYZE re-runs the
+            # statement, so only use it for read-only queries
+            explain = "EXPLAIN ANALYZE" if self._get_query_type(sql) in ("SELECT", "WITH") else "EXPLAIN"
             try:
-                plan_result = self.connection.execute(f"EXPLAIN ANALYZE {sql}").fetchall()
+                plan_result = self.connection.execute(f"{explain} {sql}").fetchall()
                 query_plan = "\n".join([str(row[0]) for row in plan_result])
             except:
                 query_plan = "Query plan not available"
@@ -140,11 +143,13 @@ class DuckDBRunner:
             return {
                 "data": data,
                 "execution_time": execution_time,
+                "execution_time_ns": execution_time_ns,
                 "rows": row_count,
                 "engine": "duckdb",
                 "query_plan": query_plan,
                 "performance_metrics": {
                     "execution_time": execution_time,
+                    "execution_time_ns": execution_time_ns,
                     "memory_used_mb": estimated_memory,
                     "rows_processed": row_count,
                     "engine": "duckdb",
@@ -155,18 +160,28 @@ class DuckDBRunner:
             }
             
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time_ns = time.perf_counter_ns() - start_ns
+            execution_time = execution_time_ns / 1e9
             
             # Return error information
             return {
                 "data": [],
                 "execution_time": execution_time,
+                "execution_time_ns": execution_time_ns,
                 "rows": 0,
                 "engine": "duckdb",
                 "error": str(e),
                 "query_plan": f"Error executing query: {str(e)}"
             }
     
+    async def execute_many(self, queries: List[str]) -> List[Dict[str, Any]]:
+        """Execute several SQL queries in order, returning one result per query"""
+        
+        if not self.is_initialized:
+            await self.initialize()
+        
+        return [await self.execute_query(sql) for sql in queries]
+    
     async def get_status(self) -> str:
         """Get runner status"""
         if not self.is_initialized:
@@ -6,10 +6,15 @@ This script creates sample protobuf data and tests the ingestion pipeline.
 """
 
 import os
+import sys
 import json
+import random
 import tempfile
+import subprocess
 from pathlib import Path
 
+from google.protobuf.internal.encoder import _VarintBytes
+
 # Sample protobuf schema for testing
 SAMPLE_PROTO = """
 syntax = "proto3";
@@ -108,26 +113,60 @@ def create_sample_files():
     
     return proto_file, schema_file
 
-def create_sample_protobuf_data():
+def compile_sample_proto(proto_file: Path):
+    """Compile the sample .proto file with protoc and import the generated module"""
+    test_dir = proto_file.parent
+    subprocess.run(
+        ["protoc", f"--proto_path={test_dir}", f"--python_out={test_dir}", str(proto_file)],
+        check=True, capture_output=True, text=True
+    )
+    
+    if str(test_dir) not in sys.path:
+        sys.path.insert(0, str(test_dir))
+    
+    import user_events_pb2
+    return user_events_pb2
+
+def create_sample_protobuf_data(proto_file: Path, count: int = 100_000):
     """
     Create sample binary protobuf data for testing
     
-    Note: This is a simplified version. In practice, you would:
-    1. Compile the .proto file with protoc --python_out
-    2. Import the generated classes
-    3. Create message instances and serialize them
-    
-    For this test, we'll create a mock binary file.
+    Compiles the sample .proto file, builds `count` UserEvent messages and
+    serializes them as a length-delimited stream (varint size prefix followed
+    by the message bytes), which is the framing the ingester decodes. Messages
+    are streamed through a 1 MiB write buffer rather than joined in memory.
     """
+    user_events_pb2 = compile_sample_proto(proto_file)
+    
     test_dir = Path("test_data")
     pb_file = test_dir / "sample_events.pb"
     
-    # Create mock binary data (in practice, this would be real protobuf-encoded data)
-    # For demonstration, we'll create a file that the ingester can attempt to process
-    mock_data = b"Mock protobuf data - in real usage this would be binary protobuf messages"
-    pb_file.write_bytes(mock_data)
+    event_types = ["click", "view", "purchase", "signup", "logout"]
+    devices = ["desktop", "mobile", "tablet"]
+    browsers = ["chrome", "firefox", "safari", "edge"]
+    locations = ["US", "CA", "UK", "DE", "FR", "JP", "AU"]
+    base_ts = 1672531200  # 2023-01-01 00:00:00 UTC
     
-    print(f"✅ Created sample protobuf data file: {pb_file}")
+    with open(pb_file, "wb", buffering=1 << 20) as f:
+        for i in range(count):
+            msg = user_events_pb2.UserEvent(
+                user_id=f"user_{random.randint(1, 1000)}",
+                event_type=random.choice(event_types),
+                timestamp=base_ts + random.randint(0, 30 * 86400),
+                page_url=f"/page_{random.randint(1, 50)}",
+                session_id=f"session_{random.randint(1, 200)}",
+                metadata=user_events_pb2.UserMetadata(
+                    device_type=random.choice(devices),
+                    browser=random.choice(browsers),
+                    location=random.choice(locations),
+                    is_premium=random.random() < 0.5
+                )
+            )
+            buf = msg.SerializeToString()
+            f.write(_VarintBytes(len(buf)))
+            f.write(buf)
+    
+    print(f"✅ Created sample protobuf data file: {pb_file} ({count:,} messages)")
     return pb_file
 
 def print_test_instructions():
@@ -165,9 +204,9 @@ def print_test_instructions():
     
     print("\n" + "="*80)
     print("📝 NOTES:")
-    print("- The sample .pb file contains mock data for demonstration")
-    print("- For real protobuf data, you would need properly encoded messages")
-    print("- The ingester will attempt to decode using the registered schema")
+    print("- The sample .pb file contains length-delimited UserEvent messages")
+    print("- Each message is prefixed with its varint-encoded size")
+    print("- The ingester decodes the stream using the registered schema")
     print("- Check the server logs for detailed processing information")
     print("="*80)
 
@@ -188,25 +227,51 @@ def test_protobuf_ingester():
             (123, "INTEGER", 123),
             (45.67, "FLOAT", 45.67),
             (True, "BOOLEAN", True),
-            ({"nested": "data"}, "RECORD", '{"nested": "data"}'),
-            ([1, 2, 3], "REPEATED", "[1, 2, 3]")
+            ({"nested": "data"}, "RECORD", '{"nested":"data"}'),
+            ([1, 2, 3], "REPEATED", "[1,2,3]")
         ]
         
         for value, field_type, expected in test_cases:
             result = ingester._convert_field_value(value, field_type)
+            assert result == expected, f"{field_type}: expected {expected!r}, got {result!r}"
             print(f"✅ Convert {value} ({field_type}) -> {result}")
         
         print("✅ Field conversion tests passed")
         
-        # Test SQL generation
+        # Test SQL generation (NULLs and int64 values beyond float precision included)
         sample_records = [
             {"user_id": "user123", "event_type": "click", "timestamp": 1234567890},
-            {"user_id": "user456", "event_type": "view", "timestamp": 1234567891}
+            {"user_id": "user456", "event_type": "view", "timestamp": 1234567891},
+            {"user_id": "user789", "event_type": None, "timestamp": None},
+            {"user_id": "user999", "event_type": "view", "timestamp": 2**60 + 1}
         ]
         
         sql = ingester._generate_bulk_insert_sql(sample_records, "user_events", "bigquery_lite")
         print(f"✅ Generated SQL:\n{sql[:200]}...")
         
+        # Test DataFrame bulk append against the generated SQL
+        import duckdb
+        
+        sql_conn = duckdb.connect()
+        append_conn = duckdb.connect()
+        for conn in (sql_conn, append_conn):
+            conn.execute("CREATE SCHEMA bigquery_lite")
+            conn.execute("""
+                CREATE TABLE bigquery_lite.user_events (
+                    user_id VARCHAR, event_type VARCHAR, timestamp BIGINT
+                )
+            """)
+        
+        sql_conn.execute(sql)
+        appended = ingester._bulk_append(sample_records, "user_events", "bigquery_lite", append_conn)
+        
+        select_sql = "SELECT * FROM bigquery_lite.user_events ORDER BY user_id"
+        assert appended == len(sample_records)
+        assert sql_conn.execute(select_sql).fetchall() == append_conn.execute(select_sql).fetchall()
+        big = "SELECT timestamp FROM bigquery_lite.user_events WHERE user_id = 'user999'"
+        assert append_conn.execute(big).fetchone()[0] == 2**60 + 1
+        print(f"✅ Bulk append matches generated SQL ({appended} records)")
+        
     except ImportError as e:
         print(f"❌ Failed to import ProtobufIngester: {e}")
     except Exception as e:
@@ -217,7 +282,7 @@ if __name__ == "__main__":
     
     # Create sample files
     proto_file, schema_file = create_sample_files()
-    pb_file = create_sample_protobuf_data()
+    pb_file = create_sample_protobuf_data(proto_file)
     
     # Test the ingester class
     test_protobuf_ingester()
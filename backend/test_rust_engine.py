@@ -9,8 +9,12 @@ Rust DataFusion-based query engine compared to the Python implementation.
 import sys
 import time
 import asyncio
+from functools import lru_cache
 from typing import Dict, Any
 
+import numpy as np
+import pyarrow as pa
+
 # Import the existing Python runners for comparison
 from runners.duckdb_runner import DuckDBRunner
 
@@ -23,31 +27,66 @@ except ImportError:
     print("    cd bigquery-lite-engine && cargo build --release")
     RUST_ENGINE_AVAILABLE = False
 
+# Shared engine instances, reused across data sizes so session/catalog setup
+# is paid once instead of per benchmark run
+_RUNNER = DuckDBRunner()
 
-async def benchmark_python_engine(queries: list, data_size: int = 100_000) -> Dict[str, Any]:
-    """Benchmark the existing Python DuckDB runner"""
-    print(f"\n🐍 Benchmarking Python DuckDB Runner ({data_size:,} rows)")
+
+@lru_cache(maxsize=None)
+def get_engine() -> "bigquery_lite_engine.BlazeQueryEngine":
+    """Create the shared Rust engine on first use, not at import time"""
+    return bigquery_lite_engine.BlazeQueryEngine()
+
+# Benchmark tables keyed by data size, built once per process
+_DATA_CACHE: Dict[int, pa.Table] = {}
+_CATEGORIES = pa.array([f"category_{i}" for i in range(10)])
+# Fixed seed so every run benchmarks byte-identical data
+_DATA_SEED = 12345
+
+
+def get_test_table(data_size: int) -> pa.Table:
+    """Build (or reuse) the Arrow benchmark table for a data size"""
+    table = _DATA_CACHE.get(data_size)
+    if table is None:
+        rng = np.random.default_rng(_DATA_SEED)
+        
+        # Dictionary-encode category so the strings are built once, not per row
+        cat_ids = rng.integers(0, 10, data_size, dtype=np.int8)
+        categories = pa.DictionaryArray.from_arrays(pa.array(cat_ids), _CATEGORIES)
+        
+        table = pa.table({
+            "id": np.arange(1, data_size + 1, dtype=np.int64),
+            "value": rng.random(data_size) * 1000,
+            "category": categories,
+        })
+        _DATA_CACHE[data_size] = table
     
-    runner = DuckDBRunner()
-    await runner.initialize()
+    return table
+
+
+async def prepare_python_data(data_size: int = 100_000):
+    """Load the benchmark table into the Python DuckDB runner"""
+    runner = _RUNNER
+    if not runner.is_initialized:
+        await runner.initialize()
     
-    # Create test data in DuckDB
-    await runner.execute_query(f"""
-        CREATE TABLE test_data AS 
-        SELECT 
-            row_number() OVER () as id,
-            random() * 1000 as value,
-            'category_' || (random() * 10)::int as category
-        FROM range({data_size})
-    """)
+    # Create test data in DuckDB from the cached Arrow table
+    runner.connection.register("test_df", get_test_table(data_size))
+    await runner.execute_query("DROP TABLE IF EXISTS test_data")
+    await runner.execute_query("CREATE TABLE test_data AS SELECT * FROM test_df")
+    runner.connection.unregister("test_df")
+
+
+async def benchmark_python_engine(queries: list, data_size: int = 100_000) -> Dict[str, Any]:
+    """Benchmark the existing Python DuckDB runner (after prepare_python_data)"""
+    print(f"\n🐍 Benchmarking Python DuckDB Runner ({data_size:,} rows)")
     
+    runner = _RUNNER
     results = []
-    for i, sql in enumerate(queries, 1):
-        print(f"  Query {i}: {sql[:50]}...")
-        
-        start_time = time.time()
+    for sql in queries:
+        start_ns = time.perf_counter_ns()
         result = await runner.execute_query(sql)
-        execution_time = time.time() - start_time
+        execution_time = (time.perf_counter_ns() - start_ns) / 1e9
         
         results.append({
             "query": sql,
@@ -55,33 +94,38 @@ async def benchmark_python_engine(queries: list, data_size: int = 100_000) -> Di
             "rows": result.get("rows", 0),
             "engine": "python_duckdb"
         })
-        
-        print(f"    ✓ Completed in {execution_time*1000:.1f}ms, {result.get('rows', 0)} rows")
     
-    await runner.cleanup()
+    # Report after the timed loop so stdout I/O stays out of the measurements
+    for i, r in enumerate(results, 1):
+        print(f"  Query {i}: {r['query'][:50]}...")
+        print(f"    ✓ Completed in {r['execution_time_ms']:.1f}ms, {r['rows']} rows")
+    
     return results
 
 
+def prepare_rust_data(data_size: int = 100_000):
+    """Register the benchmark table in the Rust engine"""
+    if not RUST_ENGINE_AVAILABLE:
+        return
+    
+    engine = get_engine()
+    engine.deregister_table("test_data")
+    engine.register_test_data("test_data", data_size)
+
+
 def benchmark_rust_engine(queries: list, data_size: int = 100_000) -> Dict[str, Any]:
-    """Benchmark the Rust BlazeQueryEngine"""
+    """Benchmark the Rust BlazeQueryEngine (after prepare_rust_data)"""
     print(f"\n🦀 Benchmarking Rust BlazeQueryEngine ({data_size:,} rows)")
     
     if not RUST_ENGINE_AVAILABLE:
         return []
     
-    engine = bigquery_lite_engine.BlazeQueryEngine()
-    
-    # Create test data in the Rust engine
-    print(f"  Creating test data with {data_size:,} rows...")
-    engine.register_test_data("test_data", data_size)
-    
+    engine = get_engine()
     results = []
-    for i, sql in enumerate(queries, 1):
-        print(f"  Query {i}: {sql[:50]}...")
-        
-        start_time = time.time()
+    for sql in queries:
+        start_ns = time.perf_counter_ns()
         result = engine.execute_query_sync(sql)
-        execution_time = time.time() - start_time
+        execution_time = (time.perf_counter_ns() - start_ns) / 1e9
         
         results.append({
             "query": sql,
@@ -91,8 +135,11 @@ def benchmark_rust_engine(queries: list, data_size: int = 100_000) -> Dict[str,
             "memory_used_mb": result.memory_used_bytes / 1024 / 1024,
             "engine": "rust_blaze"
         })
-        
-        print(f"    ✓ Completed in {result.execution_time_ms:.1f}ms, {result.rows} rows, {result.memory_used_bytes/1024/1024:.2f}MB")
+    
+    # Report after the timed loop so stdout I/O stays out of the measurements
+    for i, r in enumerate(results, 1):
+        print(f"  Query {i}: {r['query'][:50]}...")
+        print(f"    ✓ Completed in {r['execution_time_ms']:.1f}ms, {r['rows']} rows, {r['memory_used_mb']:.2f}MB")
     
     return results
 
@@ -109,42 +156,40 @@ def analyze_performance(python_results: list, rust_results: list):
     print(f"{'Query':<10} {'Python (ms)':<12} {'Rust (ms)':<10} {'Speedup':<8} {'Memory (MB)':<12}")
     print("-" * 80)
     
-    total_python_time = 0
-    total_rust_time = 0
-    speedups = []
+    n = min(len(python_results), len(rust_results))
+    python_times = np.fromiter((r["execution_time_ms"] for r in python_results[:n]), dtype=np.float64, count=n)
+    rust_times = np.fromiter((r["execution_time_ms"] for r in rust_results[:n]), dtype=np.float64, count=n)
+    memory_mb = np.fromiter((r.get("memory_used_mb", 0) for r in rust_results[:n]), dtype=np.float64, count=n)
+    speedups = np.divide(python_times, rust_times, out=np.zeros_like(python_times), where=rust_times > 0)
     
-    for i, (python_result, rust_result) in enumerate(zip(python_results, rust_results), 1):
-        python_time = python_result["execution_time_ms"]
-        rust_time = rust_result["execution_time_ms"]
-        speedup = python_time / rust_time if rust_time > 0 else 0
-        memory_mb = rust_result.get("memory_used_mb", 0)
-        
-        total_python_time += python_time
-        total_rust_time += rust_time
-        speedups.append(speedup)
-        
-        print(f"Query {i:<4} {python_time:<12.1f} {rust_time:<10.1f} {speedup:<8.1f}x {memory_mb:<12.2f}")
+    for i in range(n):
+        print(f"Query {i + 1:<4} {python_times[i]:<12.1f} {rust_times[i]:<10.1f} {speedups[i]:<8.1f}x {memory_mb[i]:<12.2f}")
     
     print("-" * 80)
+    total_python_time = python_times.sum()
+    total_rust_time = rust_times.sum()
     overall_speedup = total_python_time / total_rust_time if total_rust_time > 0 else 0
-    avg_speedup = sum(speedups) / len(speedups) if speedups else 0
+    # Median and p95 rather than the mean, which hides outlier queries
+    p50_speedup = np.median(speedups) if n else 0
+    p95_speedup = np.percentile(speedups, 95) if n else 0
     
     print(f"{'TOTAL':<10} {total_python_time:<12.1f} {total_rust_time:<10.1f} {overall_speedup:<8.1f}x")
-    print(f"{'AVERAGE':<10} {'':<12} {'':<10} {avg_speedup:<8.1f}x")
+    print(f"{'P50':<10} {'':<12} {'':<10} {p50_speedup:<8.1f}x")
+    print(f"{'P95':<10} {'':<12} {'':<10} {p95_speedup:<8.1f}x")
     
     print(f"\n🎯 Performance Summary:")
     print(f"   • Overall speedup: {overall_speedup:.1f}x")
-    print(f"   • Average speedup: {avg_speedup:.1f}x")
+    print(f"   • Median speedup: {p50_speedup:.1f}x (p95: {p95_speedup:.1f}x)")
     print(f"   • Target achieved: {'✅ YES' if overall_speedup >= 10.0 else '❌ NO'} (target: 10x)")
     
     # Memory efficiency
-    total_memory = sum(r.get("memory_used_mb", 0) for r in rust_results)
-    memory_per_query = total_memory / len(rust_results) if rust_results else 0
+    total_memory = memory_mb.sum()
+    memory_per_query = memory_mb.mean() if n else 0
     print(f"   • Memory usage: {total_memory:.2f}MB total, {memory_per_query:.2f}MB per query")
     print(f"   • Memory efficiency: {'✅ GOOD' if total_memory < 2048 else '❌ HIGH'} (target: <2GB)")
 
 
-def main():
+async def main():
     """Main benchmark execution"""
     print("🚀 BigQuery-Lite Rust Engine Benchmark")
     print("=" * 80)
@@ -167,10 +212,15 @@ def main():
         print(f"BENCHMARK: {data_size:,} rows")
         print("="*80)
         
-        # Benchmark Python engine
-        python_results = asyncio.run(benchmark_python_engine(test_queries, data_size))
-        
-        # Benchmark Rust engine
+        # Load both engines' data concurrently (the synchronous Rust setup runs
+        # in a worker thread), then time each engine alone so they do not
+        # compete for cores and memory bandwidth
+        print(f"  Creating test data with {data_size:,} rows...")
+        await asyncio.gather(
+            prepare_python_data(data_size),
+            asyncio.to_thread(prepare_rust_data, data_size),
+        )
+        python_results = await benchmark_python_engine(test_queries, data_size)
         rust_results = benchmark_rust_engine(test_queries, data_size)
         
         # Analyze results
@@ -182,7 +232,8 @@ def main():
             memory_query = "SELECT category, COUNT(*), SUM(value), AVG(value) FROM memory_test GROUP BY category"
             
             if RUST_ENGINE_AVAILABLE:
-                engine = bigquery_lite_engine.BlazeQueryEngine()
+                engine = get_engine()
+                engine.deregister_table("memory_test")
                 engine.register_test_data("memory_test", 1_000_000)
                 
                 result = engine.execute_query_sync(memory_query)
@@ -193,6 +244,8 @@ def main():
                 print(f"   • Performance target: {'✅ MET' if result.execution_time_ms < 100 else '❌ MISSED'} (<100ms)")
                 print(f"   • Memory target: {'✅ MET' if memory_gb < 2.0 else '❌ EXCEEDED'} (<2GB)")
     
+    await _RUNNER.cleanup()
+    
     print(f"\n" + "="*80)
     print("✅ Benchmark completed!")
     
@@ -211,4 +264,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
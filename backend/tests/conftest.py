@@ -4,116 +4,247 @@ Pytest configuration and fixtures for BigQuery-Lite backend tests
 
 import pytest
 import asyncio
-import tempfile
 import os
-from unittest.mock import Mock, AsyncMock
+import re
+import socket
+import uuid
+from functools import lru_cache
+from types import MappingProxyType
+from unittest.mock import Mock, MagicMock, AsyncMock
 from pathlib import Path
 
+from clickhouse_connect.driver import Client
+from pytest_asyncio import is_async_test
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from fixtures.sample_data import (
+    CLICKHOUSE_TEST_ENV, FakeClickHouseClient, SampleDataGenerator, ValidationTestCases
+)
+
+
+@lru_cache(maxsize=None)
+def clickhouse_reachable() -> bool:
+    """Probe the ClickHouse HTTP port once per session (no connect-timeout per test)"""
+    host = os.getenv("CLICKHOUSE_HOST", "localhost")
+    port = int(os.getenv("CLICKHOUSE_PORT", "8123"))
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(0.2)
+        try:
+            return sock.connect_ex((host, port)) == 0
+        except OSError:
+            return False
+
+
+def pytest_collection_modifyitems(items):
+    """Run async tests on the shared session loop; skip ClickHouse tests when it is down"""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    skip_clickhouse = pytest.mark.skip(reason="ClickHouse not available for integration tests")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+        if item.get_closest_marker("requires_clickhouse") and not clickhouse_reachable():
+            item.add_marker(skip_clickhouse)
+
+
+@pytest.fixture(scope="session")
+def clickhouse_available():
+    """Whether a ClickHouse server answered the session probe"""
+    return clickhouse_reachable()
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Use uvloop for the session event loop when it is installed"""
+    return uvloop.EventLoopPolicy() if uvloop else asyncio.DefaultEventLoopPolicy()
+
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create event loop for async tests"""
-    loop = asyncio.new_event_loop()
+def session_loop(event_loop_policy):
+    """Private loop for sync tests that drive a coroutine without pytest-asyncio"""
+    loop = event_loop_policy.new_event_loop()
     yield loop
     loop.close()
 
 
-@pytest.fixture
-def temp_db_path():
-    """Provide a temporary database path for testing"""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-        tmp_path = tmp.name
-    yield tmp_path
-    # Clean up
-    if os.path.exists(tmp_path):
-        os.unlink(tmp_path)
+@pytest.fixture(scope="session")
+def temp_db_path(tmp_path_factory):
+    """
+    Provide a database path shared by the whole session (on tmpfs when available)
+    
+    DuckDB builds its catalog and WAL once instead of per test; tests that
+    create objects isolate themselves in their own schema.
+    """
+    shm = Path("/dev/shm")
+    base = shm if shm.is_dir() and os.access(shm, os.W_OK) else tmp_path_factory.mktemp("duckdb")
+    db_path = base / f"test_{uuid.uuid4().hex}.db"
+    yield str(db_path)
+    # Clean up database and write-ahead log
+    db_path.unlink(missing_ok=True)
+    Path(f"{db_path}.wal").unlink(missing_ok=True)
 
 
-@pytest.fixture
+def _reset_clickhouse_client(mock_client):
+    """Clear calls and configured results, restoring the default `command` result"""
+    mock_client.reset_mock(return_value=True, side_effect=True)
+    mock_client.command.return_value = 1
+
+
+@pytest.fixture(scope="module")
 def mock_clickhouse_client():
-    """Mock ClickHouse client for testing"""
-    mock_client = Mock()
-    mock_client.command = Mock(return_value=1)
-    mock_client.query = Mock()
-    mock_client.close = Mock()
+    """Mock ClickHouse client built once per module and reset after every test that uses it"""
+    mock_client = MagicMock(spec=Client)
+    mock_client.command = MagicMock()
+    mock_client.query = MagicMock()
+    mock_client.close = MagicMock()
+    _reset_clickhouse_client(mock_client)
     return mock_client
 
 
+@pytest.fixture(autouse=True)
+def _reset_mock_clickhouse_client(request):
+    """Reset the module's mock ClickHouse client after each test that requested it"""
+    yield
+    if "mock_clickhouse_client" in request.fixturenames:
+        _reset_clickhouse_client(request.getfixturevalue("mock_clickhouse_client"))
+
+
 @pytest.fixture
+def fake_clickhouse_client():
+    """In-memory ClickHouse client for tests that do not assert on calls"""
+    return FakeClickHouseClient()
+
+
+@pytest.fixture(scope="module")
 def mock_duckdb_connection():
-    """Mock DuckDB connection for testing"""
+    """Mock DuckDB connection built once per module and reset after every test that uses it"""
     mock_conn = Mock()
     mock_conn.execute = Mock()
     mock_conn.close = Mock()
     return mock_conn
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset_mock_duckdb_connection(request):
+    """Reset the module's mock DuckDB connection after each test that requested it"""
+    yield
+    if "mock_duckdb_connection" in request.fixturenames:
+        request.getfixturevalue("mock_duckdb_connection").reset_mock(return_value=True, side_effect=True)
+
+
+_QUERIES = MappingProxyType({
+    "simple_select": "SELECT * FROM nyc_taxi LIMIT 10",
+    "complex_query": """
+        SELECT 
+            payment_type,
+            AVG(fare_amount) as avg_fare,
+            COUNT(*) as trip_count
+        FROM nyc_taxi 
+        WHERE fare_amount > 0 
+        GROUP BY payment_type 
+        ORDER BY avg_fare DESC
+    """,
+    "invalid_syntax": "SELECT * FRON invalid_table",
+    "window_function": """
+        SELECT 
+            id,
+            fare_amount,
+            ROW_NUMBER() OVER (ORDER BY fare_amount DESC) as rank
+        FROM nyc_taxi
+    """
+})
+
+_QUERY_RESULTS = MappingProxyType({
+    "simple_data": (
+        MappingProxyType({"id": 1, "payment_type": "cash", "fare_amount": 15.5}),
+        MappingProxyType({"id": 2, "payment_type": "credit_card", "fare_amount": 22.0}),
+        MappingProxyType({"id": 3, "payment_type": "cash", "fare_amount": 8.75})
+    ),
+    "aggregated_data": (
+        MappingProxyType({"payment_type": "credit_card", "avg_fare": 18.5, "trip_count": 150}),
+        MappingProxyType({"payment_type": "cash", "avg_fare": 16.2, "trip_count": 120})
+    )
+})
+
+
+@pytest.fixture(scope="session")
 def sample_sql_queries():
-    """Sample SQL queries for testing"""
-    return {
-        "simple_select": "SELECT * FROM nyc_taxi LIMIT 10",
-        "complex_query": """
-            SELECT 
-                payment_type,
-                AVG(fare_amount) as avg_fare,
-                COUNT(*) as trip_count
-            FROM nyc_taxi 
-            WHERE fare_amount > 0 
-            GROUP BY payment_type 
-            ORDER BY avg_fare DESC
-        """,
-        "invalid_syntax": "SELECT * FRON invalid_table",
-        "window_function": """
-            SELECT 
-                id,
-                fare_amount,
-                ROW_NUMBER() OVER (ORDER BY fare_amount DESC) as rank
-            FROM nyc_taxi
-        """
-    }
+    """Sample SQL queries for testing (shared, read-only)"""
+    return _QUERIES
 
 
-@pytest.fixture
+@pytest.fixture(params=["simple_select", "complex_query", "window_function"])
+def sql_query(request):
+    """Valid SQL query, one test node per variant"""
+    return _QUERIES[request.param]
+
+
+@pytest.fixture(scope="session")
 def sample_query_results():
-    """Sample query results for testing"""
-    return {
-        "simple_data": [
-            {"id": 1, "payment_type": "cash", "fare_amount": 15.5},
-            {"id": 2, "payment_type": "credit_card", "fare_amount": 22.0},
-            {"id": 3, "payment_type": "cash", "fare_amount": 8.75}
-        ],
-        "aggregated_data": [
-            {"payment_type": "credit_card", "avg_fare": 18.5, "trip_count": 150},
-            {"payment_type": "cash", "avg_fare": 16.2, "trip_count": 120}
-        ]
-    }
+    """Sample query results for testing (shared, read-only)"""
+    return _QUERY_RESULTS
+
+
+@pytest.fixture(params=["simple_data", "aggregated_data"])
+def query_result_rows(request):
+    """Sample result rows, one test node per variant"""
+    return _QUERY_RESULTS[request.param]
+
+
+@pytest.fixture
+def table_name(request):
+    """Table name unique to the running test, safe to register on a shared engine"""
+    base = re.sub(r"\W", "_", request.node.name)
+    return f"{base}_{uuid.uuid4().hex[:8]}"
 
 
 @pytest.fixture
 def clickhouse_env_vars(monkeypatch):
     """Set ClickHouse environment variables for testing"""
-    env_vars = {
-        "CLICKHOUSE_HOST": "localhost",
-        "CLICKHOUSE_PORT": "8123",
-        "CLICKHOUSE_USER": "test_user", 
-        "CLICKHOUSE_PASSWORD": "test_password"
-    }
-    
-    for key, value in env_vars.items():
+    for key, value in CLICKHOUSE_TEST_ENV.items():
         monkeypatch.setenv(key, value)
     
-    return env_vars
+    return dict(CLICKHOUSE_TEST_ENV)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def performance_metrics_sample():
-    """Sample performance metrics for testing"""
-    return {
+    """Sample performance metrics for testing (shared, read-only)"""
+    return MappingProxyType({
         "execution_time": 0.125,
         "memory_used_mb": 2.5,
         "rows_processed": 1000,
         "cpu_time": 0.075,
         "io_wait": 0.025,
         "network_time": 0.025
-    }
\ No newline at end of file
+    })
+
+# Fixed seed so sample_taxi_data and sample_taxi_table hold the same rows
+SAMPLE_TAXI_SEED = 2023
+
+
+@pytest.fixture(scope="session")
+def sample_taxi_data():
+    """100-row NYC taxi dataset, built once per session (read-only)"""
+    return SampleDataGenerator.generate_nyc_taxi_data(100, seed=SAMPLE_TAXI_SEED)
+
+
+@pytest.fixture(scope="session")
+def sample_taxi_table():
+    """100-row NYC taxi dataset as an Arrow table, built once per session"""
+    return SampleDataGenerator.generate_nyc_taxi_table(100, seed=SAMPLE_TAXI_SEED)
+
+
+@pytest.fixture(scope="session")
+def sample_user_events():
+    """50-row user event dataset, built once per session (read-only)"""
+    return SampleDataGenerator.generate_user_events(50)
+
+
+@pytest.fixture(scope="session")
+def validation_test_cases():
+    """Query validation test cases (shared, read-only)"""
+    return ValidationTestCases.get_validation_test_cases()
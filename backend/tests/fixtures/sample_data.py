@@ -5,191 +5,375 @@ Provides common test data, mock responses, and utility functions
 for testing DuckDB and ClickHouse runners.
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, List, Any
-import random
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType, SimpleNamespace
+from typing import Dict, Any, Mapping, Optional, Sequence, Tuple
+import textwrap
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# Numba is optional; it only speeds up bulk generation for stress tests
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Below this size JIT compilation costs more than it saves
+NUMBA_MIN_ROWS = 100_000
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _taxi_arithmetic_njit(fare, tip_frac, extra, dist, day, hr, minute, dur,
+                              out_fare, out_tip, out_total, out_dist, out_pickup, out_dropoff):
+        """Derive taxi columns from pre-drawn integers in one fused parallel pass
+        
+        Holds no random state, so the output depends only on the seeded draws.
+        """
+        for i in prange(fare.size):
+            tip = np.int64(tip_frac[i] * (fare[i] * 30 // 100 + 1))
+            out_fare[i] = fare[i] / 100.0
+            out_tip[i] = tip / 100.0
+            out_total[i] = (fare[i] + tip + extra[i]) / 100.0
+            out_dist[i] = dist[i] / 100.0
+            out_pickup[i] = day[i] * 86400 + hr[i] * 3600 + minute[i] * 60
+            out_dropoff[i] = out_pickup[i] + dur[i] * 60
+
+
+def _taxi_columns(count: int, rng: np.random.Generator) -> Dict[str, np.ndarray]:
+    """Draw the NYC taxi columns from `rng`, using the Numba kernel for bulk arithmetic"""
+    # Money and distance are drawn as integer cents, so no rounding is needed
+    fare = rng.integers(500, 5001, count)
+    tip_frac = rng.random(count)
+    extra = rng.integers(50, 301, count)
+    dist = rng.integers(50, 1501, count)
+    pax = rng.integers(1, 7, count)
+    day = rng.integers(0, 366, count)
+    hr = rng.integers(0, 24, count)
+    minute = rng.integers(0, 60, count)
+    dur = rng.integers(5, 121, count)
+    pt_idx = rng.integers(0, 4, count)
+    
+    if NUMBA_AVAILABLE and count >= NUMBA_MIN_ROWS:
+        columns = {name: np.empty(count) for name in ("fare", "tip", "total", "dist")}
+        columns.update({name: np.empty(count, dtype=np.int64) for name in ("pickup", "dropoff")})
+        _taxi_arithmetic_njit(
+            fare, tip_frac, extra, dist, day, hr, minute, dur,
+            columns["fare"], columns["tip"], columns["total"], columns["dist"],
+            columns["pickup"], columns["dropoff"]
+        )
+    else:
+        tip = (tip_frac * (fare * 30 // 100 + 1)).astype(np.int64)
+        pickup = day * 86400 + hr * 3600 + minute * 60
+        columns = {
+            "fare": fare / 100.0,
+            "tip": tip / 100.0,
+            "total": (fare + tip + extra) / 100.0,
+            "dist": dist / 100.0,
+            "pickup": pickup,
+            "dropoff": pickup + dur * 60,
+        }
+    
+    columns["pax"] = pax
+    columns["pt_idx"] = pt_idx
+    return columns
 
 
 class SampleDataGenerator:
     """Generator for sample test data"""
     
     @staticmethod
-    def generate_nyc_taxi_data(count: int = 100) -> List[Dict[str, Any]]:
-        """Generate sample NYC taxi trip data"""
-        payment_types = ["cash", "credit_card", "dispute", "no_charge"]
-        base_time = datetime(2023, 1, 1)
+    @lru_cache(maxsize=None)
+    def generate_nyc_taxi_table(count: int = 100, seed: Optional[int] = None) -> pa.Table:
+        """Generate sample NYC taxi trip data as a columnar Arrow table (cached per count and seed)"""
+        payment_types = pa.array(["cash", "credit_card", "dispute", "no_charge"])
+        base_time = np.datetime64(datetime(2023, 1, 1), "s")
+        cols = _taxi_columns(count, np.random.default_rng(seed))
         
-        data = []
-        for i in range(count):
-            pickup_time = base_time + timedelta(
-                days=random.randint(0, 365),
-                hours=random.randint(0, 23),
-                minutes=random.randint(0, 59)
-            )
-            
-            trip_duration = timedelta(minutes=random.randint(5, 120))
-            dropoff_time = pickup_time + trip_duration
-            
-            fare_amount = round(random.uniform(5.0, 50.0), 2)
-            tip_amount = round(random.uniform(0.0, fare_amount * 0.3), 2)
-            total_amount = round(fare_amount + tip_amount + random.uniform(0.5, 3.0), 2)
-            
-            data.append({
-                "id": i + 1,
-                "payment_type": random.choice(payment_types),
-                "fare_amount": fare_amount,
-                "trip_distance": round(random.uniform(0.5, 15.0), 2),
-                "total_amount": total_amount,
-                "passenger_count": random.randint(1, 6),
-                "tpep_pickup_datetime": pickup_time,
-                "tpep_dropoff_datetime": dropoff_time,
-                "tip_amount": tip_amount
-            })
+        # One datetime64[s] offset per row rather than separate day/hour/minute deltas
+        pickup_time = base_time + cols["pickup"].astype("timedelta64[s]")
+        dropoff_time = base_time + cols["dropoff"].astype("timedelta64[s]")
         
-        return data
+        return pa.table({
+            "id": pa.array(np.arange(1, count + 1), type=pa.int64()),
+            "payment_type": pa.DictionaryArray.from_arrays(cols["pt_idx"].astype(np.int8), payment_types),
+            "fare_amount": cols["fare"],
+            "trip_distance": cols["dist"],
+            "total_amount": cols["total"],
+            "passenger_count": cols["pax"].astype(np.int8),
+            "tpep_pickup_datetime": pickup_time,
+            "tpep_dropoff_datetime": dropoff_time,
+            "tip_amount": cols["tip"]
+        })
 
     @staticmethod
-    def generate_user_events(count: int = 50) -> List[Dict[str, Any]]:
-        """Generate sample user event data"""
-        event_types = ["click", "view", "purchase", "signup", "logout"]
-        devices = ["desktop", "mobile", "tablet"]
-        browsers = ["chrome", "firefox", "safari", "edge"]
-        locations = ["US", "CA", "UK", "DE", "FR", "JP", "AU"]
+    @lru_cache(maxsize=None)
+    def generate_nyc_taxi_data(count: int = 100, seed: Optional[int] = None) -> Tuple[Mapping[str, Any], ...]:
+        """Generate sample NYC taxi trip data as rows (cached per count and seed, read-only)"""
+        table = SampleDataGenerator.generate_nyc_taxi_table(count, seed)
+        return tuple(MappingProxyType(row) for row in table.to_pylist())
+
+    @staticmethod
+    def generate_user_events_df(count: int = 50) -> pd.DataFrame:
+        """Generate sample user event data as a flat DataFrame"""
+        event_types = np.array(["click", "view", "purchase", "signup", "logout"])
+        devices = np.array(["desktop", "mobile", "tablet"])
+        browsers = np.array(["chrome", "firefox", "safari", "edge"])
+        locations = np.array(["US", "CA", "UK", "DE", "FR", "JP", "AU"])
         
-        data = []
-        base_time = datetime(2023, 1, 1)
+        base_ts = int(datetime(2023, 1, 1).timestamp())
+        rng = np.random.default_rng()
         
-        for i in range(count):
-            event_time = base_time + timedelta(
-                days=random.randint(0, 30),
-                hours=random.randint(0, 23),
-                minutes=random.randint(0, 59),
-                seconds=random.randint(0, 59)
-            )
-            
-            data.append({
-                "user_id": f"user_{random.randint(1, 1000)}",
-                "event_type": random.choice(event_types),
-                "timestamp": int(event_time.timestamp()),
-                "page_url": f"/page_{random.randint(1, 50)}",
-                "session_id": f"session_{random.randint(1, 200)}",
-                "metadata": {
-                    "device_type": random.choice(devices),
-                    "browser": random.choice(browsers),
-                    "location": random.choice(locations),
-                    "is_premium": random.choice([True, False])
-                }
-            })
+        return pd.DataFrame({
+            "user_id": np.char.add("user_", rng.integers(1, 1001, count).astype(str)),
+            "event_type": rng.choice(event_types, count),
+            "timestamp": base_ts + rng.integers(0, 31 * 86400, count),
+            "page_url": np.char.add("/page_", rng.integers(1, 51, count).astype(str)),
+            "session_id": np.char.add("session_", rng.integers(1, 201, count).astype(str)),
+            "device_type": rng.choice(devices, count),
+            "browser": rng.choice(browsers, count),
+            "location": rng.choice(locations, count),
+            "is_premium": rng.integers(0, 2, count).astype(bool)
+        })
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def generate_user_events(count: int = 50) -> Tuple[Mapping[str, Any], ...]:
+        """Generate sample user event data (cached per count, read-only)"""
+        df = SampleDataGenerator.generate_user_events_df(count)
         
-        return data
+        return tuple(
+            MappingProxyType({
+                "user_id": user_id,
+                "event_type": event_type,
+                "timestamp": timestamp,
+                "page_url": page_url,
+                "session_id": session_id,
+                "metadata": MappingProxyType({
+                    "device_type": device_type,
+                    "browser": browser,
+                    "location": location,
+                    "is_premium": is_premium
+                })
+            })
+            for (user_id, event_type, timestamp, page_url, session_id,
+                 device_type, browser, location, is_premium) in zip(*(df[col].tolist() for col in df.columns))
+        )
 
     @staticmethod
-    def generate_sample_metrics() -> Dict[str, Any]:
-        """Generate sample performance metrics"""
-        return {
-            "execution_time": round(random.uniform(0.01, 2.0), 3),
-            "memory_used_mb": round(random.uniform(0.1, 100.0), 2),
-            "rows_processed": random.randint(1, 10000),
-            "cpu_time": round(random.uniform(0.005, 1.5), 3),
-            "io_wait": round(random.uniform(0.001, 0.5), 3),
-            "network_time": round(random.uniform(0.0, 0.2), 3)
-        }
+    @lru_cache(maxsize=1024)
+    def generate_sample_metrics(index: int = 0) -> Mapping[str, Any]:
+        """Generate sample performance metrics (seeded by index, cached, read-only)"""
+        rng = np.random.default_rng(index)
+        return MappingProxyType({
+            "execution_time": int(rng.integers(10, 2001)) / 1000.0,
+            "memory_used_mb": int(rng.integers(10, 10001)) / 100.0,
+            "rows_processed": int(rng.integers(1, 10001)),
+            "cpu_time": int(rng.integers(5, 1501)) / 1000.0,
+            "io_wait": int(rng.integers(1, 501)) / 1000.0,
+            "network_time": int(rng.integers(0, 201)) / 1000.0
+        })
+
+
+def insert_rows(runner, table_name: str, rows: Sequence[Mapping[str, Any]]) -> int:
+    """
+    Bulk-insert rows into a table on a real runner
+    
+    Rows are converted to one Arrow table, so the database sees a single
+    columnar batch instead of parsing a VALUES statement per fixture.
+    Columns not present in the rows keep their table defaults.
+    
+    Returns:
+        Number of rows inserted
+    """
+    if not rows:
+        return 0
+    
+    arrow_table = pa.Table.from_pylist([dict(row) for row in rows])
+    columns = arrow_table.column_names
+    
+    if getattr(runner, "client", None) is not None:
+        # ClickHouse: one native insert for the whole batch
+        runner.client.insert_arrow(table_name, arrow_table)
+    else:
+        # DuckDB: scan the Arrow table directly, no SQL literals to parse
+        column_list = ", ".join(columns)
+        runner.connection.register("_insert_rows_batch", arrow_table)
+        try:
+            runner.connection.execute(
+                f"INSERT INTO {table_name} ({column_list}) SELECT {column_list} FROM _insert_rows_batch"
+            )
+        finally:
+            runner.connection.unregister("_insert_rows_batch")
+    
+    return arrow_table.num_rows
+
+
+# Connection settings the ClickHouse unit tests construct runners with
+CLICKHOUSE_TEST_ENV = MappingProxyType({
+    "CLICKHOUSE_HOST": "localhost",
+    "CLICKHOUSE_PORT": "8123",
+    "CLICKHOUSE_USER": "test_user",
+    "CLICKHOUSE_PASSWORD": "test_password"
+})
+
+_CLICKHOUSE_TABLE_INFO = (
+    ("nyc_taxi", "MergeTree"),
+    ("sample_data", "MergeTree"),
+    ("user_events", "MergeTree")
+)
+
+_CLICKHOUSE_COLUMN_INFO = (
+    ("id", "UInt64"),
+    ("payment_type", "String"),
+    ("fare_amount", "Float64"),
+    ("trip_distance", "Float64"),
+    ("total_amount", "Float64"),
+    ("passenger_count", "UInt8"),
+    ("tpep_pickup_datetime", "DateTime"),
+    ("tpep_dropoff_datetime", "DateTime"),
+    ("tip_amount", "Float64")
+)
+
+_DUCKDB_TABLE_INFO = (
+    ("nyc_taxi", "BASE TABLE"),
+    ("sample_data", "BASE TABLE"),
+    ("user_events", "BASE TABLE")
+)
+
+_DUCKDB_COLUMN_INFO = (
+    ("id", "INTEGER"),
+    ("payment_type", "VARCHAR"),
+    ("fare_amount", "DOUBLE"),
+    ("trip_distance", "DOUBLE"),
+    ("total_amount", "DOUBLE"),
+    ("passenger_count", "INTEGER"),
+    ("tpep_pickup_datetime", "TIMESTAMP"),
+    ("tpep_dropoff_datetime", "TIMESTAMP"),
+    ("tip_amount", "DOUBLE")
+)
+
+_CLICKHOUSE_CLUSTER_INFO = (
+    ("test_cluster", 1, 1, "localhost", 9000),
+    ("test_cluster", 1, 2, "localhost", 9001),
+    ("test_cluster", 2, 1, "localhost", 9002)
+)
+
+_CLICKHOUSE_SERVER_INFO = (("23.8.1.1", "test-server", 86400),)  # version, hostname, uptime
+
+_QUERY_EXPLAIN_PLAN = (
+    "Seq Scan on nyc_taxi (cost=0.00..180.00 rows=10000 width=32)",
+    "Filter: (fare_amount > 0::double precision)",
+    "Planning time: 0.123 ms",
+    "Execution time: 45.678 ms"
+)
 
 
 class MockResponses:
-    """Mock responses for testing database interactions"""
+    """Mock responses for testing database interactions (shared, read-only)"""
     
     @staticmethod
-    def clickhouse_table_info() -> List[tuple]:
+    def clickhouse_table_info() -> Tuple[tuple, ...]:
         """Mock ClickHouse table information response"""
-        return [
-            ("nyc_taxi", "MergeTree"),
-            ("sample_data", "MergeTree"),
-            ("user_events", "MergeTree")
-        ]
+        return _CLICKHOUSE_TABLE_INFO
     
     @staticmethod
-    def clickhouse_column_info() -> List[tuple]:
+    def clickhouse_column_info() -> Tuple[tuple, ...]:
         """Mock ClickHouse column information response"""
-        return [
-            ("id", "UInt64"),
-            ("payment_type", "String"),
-            ("fare_amount", "Float64"),
-            ("trip_distance", "Float64"),
-            ("total_amount", "Float64"),
-            ("passenger_count", "UInt8"),
-            ("tpep_pickup_datetime", "DateTime"),
-            ("tpep_dropoff_datetime", "DateTime"),
-            ("tip_amount", "Float64")
-        ]
+        return _CLICKHOUSE_COLUMN_INFO
     
     @staticmethod
-    def duckdb_table_info() -> List[tuple]:
+    def duckdb_table_info() -> Tuple[tuple, ...]:
         """Mock DuckDB table information response"""
-        return [
-            ("nyc_taxi", "BASE TABLE"),
-            ("sample_data", "BASE TABLE"),
-            ("user_events", "BASE TABLE")
-        ]
+        return _DUCKDB_TABLE_INFO
     
     @staticmethod
-    def duckdb_column_info() -> List[tuple]:
+    def duckdb_column_info() -> Tuple[tuple, ...]:
         """Mock DuckDB column information response"""
-        return [
-            ("id", "INTEGER"),
-            ("payment_type", "VARCHAR"),
-            ("fare_amount", "DOUBLE"),
-            ("trip_distance", "DOUBLE"),
-            ("total_amount", "DOUBLE"),
-            ("passenger_count", "INTEGER"),
-            ("tpep_pickup_datetime", "TIMESTAMP"),
-            ("tpep_dropoff_datetime", "TIMESTAMP"),
-            ("tip_amount", "DOUBLE")
-        ]
+        return _DUCKDB_COLUMN_INFO
     
     @staticmethod
-    def clickhouse_cluster_info() -> List[tuple]:
+    def clickhouse_cluster_info() -> Tuple[tuple, ...]:
         """Mock ClickHouse cluster information response"""
-        return [
-            ("test_cluster", 1, 1, "localhost", 9000),
-            ("test_cluster", 1, 2, "localhost", 9001),
-            ("test_cluster", 2, 1, "localhost", 9002)
-        ]
+        return _CLICKHOUSE_CLUSTER_INFO
     
     @staticmethod
-    def clickhouse_server_info() -> List[tuple]:
+    def clickhouse_server_info() -> Tuple[tuple, ...]:
         """Mock ClickHouse server information response"""
-        return [("23.8.1.1", "test-server", 86400)]  # version, hostname, uptime
+        return _CLICKHOUSE_SERVER_INFO
     
     @staticmethod
-    def query_explain_plan() -> List[str]:
+    def query_explain_plan() -> Tuple[str, ...]:
         """Mock query execution plan"""
-        return [
-            "Seq Scan on nyc_taxi (cost=0.00..180.00 rows=10000 width=32)",
-            "Filter: (fare_amount > 0::double precision)",
-            "Planning time: 0.123 ms",
-            "Execution time: 45.678 ms"
-        ]
+        return _QUERY_EXPLAIN_PLAN
+
+
+class FakeClickHouseClient:
+    """In-memory stand-in for a clickhouse_connect client
+    
+    Tests queue responses for ``command`` and ``query``; an Exception in the
+    queue is raised instead of returned. Once a queue is empty, ``command``
+    returns 1 and ``query`` returns an empty result.
+    """
+    
+    __slots__ = ("command_queue", "query_queue", "closed")
+    
+    def __init__(self):
+        self.command_queue = deque()
+        self.query_queue = deque()
+        self.closed = False
+    
+    @staticmethod
+    def _next(queue: deque, default: Any) -> Any:
+        response = queue.popleft() if queue else default
+        if isinstance(response, Exception):
+            raise response
+        return response
+    
+    def command(self, sql: str, *args, **kwargs) -> Any:
+        return self._next(self.command_queue, 1)
+    
+    def query(self, sql: str, *args, **kwargs) -> Any:
+        return self._next(self.query_queue, SimpleNamespace(result_rows=[], column_names=[]))
+    
+    def close(self):
+        self.closed = True
+
+
+def _dedent_sql(sql: str) -> str:
+    """Dedent and strip a triple-quoted SQL literal once at import"""
+    return textwrap.dedent(sql).strip()
 
 
 class TestQueries:
-    """Collection of test SQL queries"""
+    """
+    Collection of test SQL queries
     
-    SIMPLE_QUERIES = [
+    Multi-line queries are dedented and stripped once at import. They stay
+    `str` because the runners format and pattern-match the SQL text.
+    """
+    
+    SIMPLE_QUERIES = (
         "SELECT 1",
         "SELECT 1 as test_value",
         "SELECT 'hello' as greeting",
         "SELECT NOW() as current_time"
-    ]
+    )
     
-    BASIC_SELECT_QUERIES = [
+    BASIC_SELECT_QUERIES = (
         "SELECT * FROM nyc_taxi LIMIT 10",
         "SELECT payment_type, fare_amount FROM nyc_taxi LIMIT 5",
         "SELECT COUNT(*) FROM sample_data",
         "SELECT AVG(fare_amount) as avg_fare FROM nyc_taxi"
-    ]
+    )
     
-    COMPLEX_QUERIES = [
+    COMPLEX_QUERIES = tuple(_dedent_sql(q) for q in (
         """
         SELECT 
             payment_type,
@@ -233,12 +417,12 @@ class TestQueries:
         JOIN trip_stats ts ON t.payment_type = ts.payment_type
         LIMIT 100
         """
-    ]
+    ))
     
-    WINDOW_FUNCTION_QUERIES = [
+    WINDOW_FUNCTION_QUERIES = tuple(_dedent_sql(q) for q in (
         """
         SELECT 
-            id,
+            tpep_pickup_datetime,
             fare_amount,
             ROW_NUMBER() OVER (ORDER BY fare_amount DESC) as rank,
             LAG(fare_amount) OVER (ORDER BY tpep_pickup_datetime) as prev_fare
@@ -255,77 +439,91 @@ class TestQueries:
         FROM nyc_taxi 
         LIMIT 50
         """
-    ]
+    ))
     
-    INVALID_QUERIES = [
+    INVALID_QUERIES = (
         "SELECT * FRON invalid_table",  # Typo in FROM
         "SELECT COUNT(* FROM table",    # Missing closing parenthesis
         "INSERT INTO VALUES (1, 2)",    # Missing table name
         "UPDATE SET col = 1",           # Missing table name
         "SELECT * FROM",                # Incomplete query
         "INVALID SQL SYNTAX HERE"       # Completely invalid
-    ]
+    )
     
-    QUERIES_WITH_WARNINGS = [
+    QUERIES_WITH_WARNINGS = (
         "SELECT * FROM nyc_taxi",  # Should warn about SELECT *
         "SELECT fare_amount FROM nyc_taxi",  # Should warn about missing LIMIT
         "SELECT payment_type FROM nyc_taxi WHERE 1=1",  # Should warn about scanning entire table
-    ]
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationCase:
+    """A single query validation test case"""
+    name: str
+    query: str
+    expected_valid: bool
+    expected_type: str
+    expected_tables: Tuple[str, ...]
+    should_have_warnings: bool
+
+
+_VALIDATION_TEST_CASES = (
+    ValidationCase(
+        name="valid_simple_select",
+        query="SELECT * FROM nyc_taxi LIMIT 10",
+        expected_valid=True,
+        expected_type="SELECT",
+        expected_tables=("nyc_taxi",),
+        should_have_warnings=True  # SELECT * warning
+    ),
+    ValidationCase(
+        name="valid_aggregate",
+        query="SELECT COUNT(*), AVG(fare_amount) FROM nyc_taxi WHERE fare_amount > 0",
+        expected_valid=True,
+        expected_type="SELECT",
+        expected_tables=("nyc_taxi",),
+        should_have_warnings=False
+    ),
+    ValidationCase(
+        name="valid_join",
+        query="SELECT t1.fare_amount, t2.value FROM nyc_taxi t1 JOIN sample_data t2 ON t1.passenger_count = t2.id",
+        expected_valid=True,
+        expected_type="SELECT",
+        expected_tables=("nyc_taxi", "sample_data"),
+        should_have_warnings=False
+    ),
+    ValidationCase(
+        name="invalid_syntax",
+        query="SELECT * FRON invalid_table",
+        expected_valid=False,
+        expected_type="SELECT",
+        expected_tables=("invalid_table",),
+        should_have_warnings=False
+    ),
+    ValidationCase(
+        name="empty_query",
+        query="",
+        expected_valid=False,
+        expected_type="UNKNOWN",
+        expected_tables=(),
+        should_have_warnings=False
+    ),
+    ValidationCase(
+        name="with_query",
+        query="WITH cte AS (SELECT * FROM nyc_taxi) SELECT * FROM cte LIMIT 5",
+        expected_valid=True,
+        expected_type="WITH",
+        expected_tables=("nyc_taxi",),
+        should_have_warnings=False
+    )
+)
 
 
 class ValidationTestCases:
     """Test cases for query validation"""
     
     @staticmethod
-    def get_validation_test_cases() -> List[Dict[str, Any]]:
-        """Get comprehensive validation test cases"""
-        return [
-            {
-                "name": "valid_simple_select",
-                "query": "SELECT * FROM nyc_taxi LIMIT 10",
-                "expected_valid": True,
-                "expected_type": "SELECT",
-                "expected_tables": ["nyc_taxi"],
-                "should_have_warnings": True  # SELECT * warning
-            },
-            {
-                "name": "valid_aggregate",
-                "query": "SELECT COUNT(*), AVG(fare_amount) FROM nyc_taxi WHERE fare_amount > 0",
-                "expected_valid": True,
-                "expected_type": "SELECT",
-                "expected_tables": ["nyc_taxi"],
-                "should_have_warnings": False
-            },
-            {
-                "name": "valid_join",
-                "query": "SELECT t1.id, t2.value FROM nyc_taxi t1 JOIN sample_data t2 ON t1.id = t2.id",
-                "expected_valid": True,
-                "expected_type": "SELECT",
-                "expected_tables": ["nyc_taxi", "sample_data"],
-                "should_have_warnings": False
-            },
-            {
-                "name": "invalid_syntax",
-                "query": "SELECT * FRON invalid_table",
-                "expected_valid": False,
-                "expected_type": "SELECT",
-                "expected_tables": ["invalid_table"],
-                "should_have_warnings": False
-            },
-            {
-                "name": "empty_query",
-                "query": "",
-                "expected_valid": False,
-                "expected_type": "UNKNOWN",
-                "expected_tables": [],
-                "should_have_warnings": False
-            },
-            {
-                "name": "with_query",
-                "query": "WITH cte AS (SELECT * FROM nyc_taxi) SELECT * FROM cte LIMIT 5",
-                "expected_valid": True,
-                "expected_type": "WITH",
-                "expected_tables": ["nyc_taxi"],
-                "should_have_warnings": False
-            }
-        ]
\ No newline at end of file
+    def get_validation_test_cases() -> Tuple[ValidationCase, ...]:
+        """Get comprehensive validation test cases (shared, immutable)"""
+        return _VALIDATION_TEST_CASES
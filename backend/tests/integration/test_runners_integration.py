@@ -14,29 +14,59 @@ if no ClickHouse instance is available.
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
 import tempfile
 import os
+import uuid
 from unittest.mock import patch
 
 from runners.duckdb_runner import DuckDBRunner
 from runners.clickhouse_runner import ClickHouseRunner
+from fixtures.sample_data import TestQueries, insert_rows
 
 
+DUCKDB_POOL_SIZE = 2
+
+
+@pytest_asyncio.fixture(scope="session")
+async def duckdb_runner_pool(temp_db_path):
+    """Pool of DuckDBRunners initialized once per session (or once per xdist worker)"""
+    pool = [DuckDBRunner(db_path=temp_db_path) for _ in range(DUCKDB_POOL_SIZE)]
+    await asyncio.gather(*(runner.initialize() for runner in pool))
+    yield pool
+    await asyncio.gather(*(runner.cleanup() for runner in pool))
+
+
+@pytest.fixture
+def pooled_duckdb_runner(duckdb_runner_pool):
+    """Check a runner out of the pool, with tables created in a per-test schema"""
+    runner = duckdb_runner_pool.pop()
+    schema = f"test_{uuid.uuid4().hex}"
+    connection = runner.connection
+    connection.execute(f"CREATE SCHEMA {schema}")
+    connection.execute(f"SET schema = '{schema}'")
+    connection.execute(f"SET search_path = '{schema},main'")
+    try:
+        yield runner
+    finally:
+        connection.execute("SET schema = 'main'")
+        connection.execute("RESET search_path")
+        connection.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+        duckdb_runner_pool.append(runner)
+
+
+@pytest.mark.xdist_group("duckdb")
 class TestDuckDBIntegration:
     """Integration tests for DuckDBRunner with real database"""
 
     @pytest.fixture
-    async def duckdb_runner(self, temp_db_path):
-        """Create and initialize a real DuckDBRunner instance"""
-        runner = DuckDBRunner(db_path=temp_db_path)
-        await runner.initialize()
-        yield runner
-        await runner.cleanup()
+    def duckdb_runner(self, pooled_duckdb_runner):
+        """Pooled DuckDBRunner isolated in its own schema"""
+        return pooled_duckdb_runner
 
     @pytest.mark.integration
     @pytest.mark.requires_duckdb
-    @pytest.mark.asyncio
     async def test_duckdb_full_workflow(self, duckdb_runner):
         """Test complete DuckDB workflow with real database"""
         
@@ -49,18 +79,17 @@ class TestDuckDBIntegration:
         assert result["engine"] == "duckdb"
         assert result["rows"] == 1
         assert result["data"][0]["test_value"] == 1
-        assert result["execution_time"] > 0
+        assert result["execution_time_ns"] > 0
         
         # Test performance metrics
         assert "performance_metrics" in result
         metrics = result["performance_metrics"]
         assert metrics["engine"] == "duckdb"
-        assert metrics["execution_time"] > 0
+        assert metrics["execution_time_ns"] > 0
         assert metrics["rows_processed"] == 1
 
     @pytest.mark.integration
     @pytest.mark.requires_duckdb
-    @pytest.mark.asyncio
     async def test_duckdb_table_operations(self, duckdb_runner):
         """Test table creation and data operations"""
         
@@ -77,14 +106,12 @@ class TestDuckDBIntegration:
         assert "error" not in result
         
         # Insert test data
-        insert_sql = """
-            INSERT INTO test_users (id, name, age) VALUES 
-            (1, 'Alice', 25),
-            (2, 'Bob', 30),
-            (3, 'Charlie', 35)
-        """
-        result = await duckdb_runner.execute_query(insert_sql)
-        assert "error" not in result
+        inserted = insert_rows(duckdb_runner, "test_users", [
+            {"id": 1, "name": "Alice", "age": 25},
+            {"id": 2, "name": "Bob", "age": 30},
+            {"id": 3, "name": "Charlie", "age": 35}
+        ])
+        assert inserted == 3
         
         # Query the data
         select_sql = "SELECT id, name, age FROM test_users ORDER BY id"
@@ -104,7 +131,6 @@ class TestDuckDBIntegration:
 
     @pytest.mark.integration
     @pytest.mark.requires_duckdb
-    @pytest.mark.asyncio
     async def test_duckdb_schema_operations(self, duckdb_runner):
         """Test schema information retrieval"""
         
@@ -125,7 +151,6 @@ class TestDuckDBIntegration:
 
     @pytest.mark.integration
     @pytest.mark.requires_duckdb
-    @pytest.mark.asyncio
     async def test_duckdb_query_validation(self, duckdb_runner):
         """Test query validation with real database"""
         
@@ -143,7 +168,138 @@ class TestDuckDBIntegration:
 
     @pytest.mark.integration
     @pytest.mark.requires_duckdb
-    @pytest.mark.asyncio
+    async def test_duckdb_validation_cases(self, duckdb_runner, validation_test_cases):
+        """Test query validation against the shared validation cases"""
+
+        for case in validation_test_cases:
+            validation = await duckdb_runner.validate_query(case.query)
+
+            assert validation["valid"] is case.expected_valid, case.name
+            assert validation["query_type"] == case.expected_type, case.name
+            if case.expected_valid:
+                assert set(case.expected_tables) <= set(validation["affected_tables"]), case.name
+                if case.should_have_warnings:
+                    assert validation["warnings"], case.name
+            else:
+                assert validation["errors"], case.name
+
+    @pytest.mark.integration
+    @pytest.mark.requires_duckdb
+    async def test_duckdb_validates_shared_queries(self, duckdb_runner):
+        """Test validation of every shared test query against the sample tables"""
+
+        valid_queries = (
+            TestQueries.SIMPLE_QUERIES + TestQueries.BASIC_SELECT_QUERIES
+            + TestQueries.COMPLEX_QUERIES + TestQueries.WINDOW_FUNCTION_QUERIES
+        )
+        for sql in valid_queries:
+            validation = await duckdb_runner.validate_query(sql)
+            assert validation["valid"] is True, (sql, validation["errors"])
+
+        for sql in TestQueries.INVALID_QUERIES:
+            validation = await duckdb_runner.validate_query(sql)
+            assert validation["valid"] is False, sql
+
+        for sql in TestQueries.QUERIES_WITH_WARNINGS:
+            validation = await duckdb_runner.validate_query(sql)
+            assert validation["warnings"], sql
+
+    @pytest.mark.integration
+    @pytest.mark.requires_duckdb
+    async def test_duckdb_taxi_data_ingestion(self, duckdb_runner, sample_taxi_data):
+        """Test inserting the shared taxi rows and aggregating them"""
+
+        create_sql = """
+            CREATE TABLE taxi_trips (
+                id BIGINT,
+                payment_type VARCHAR,
+                fare_amount DOUBLE,
+                trip_distance DOUBLE,
+                total_amount DOUBLE,
+                passenger_count TINYINT,
+                tpep_pickup_datetime TIMESTAMP,
+                tpep_dropoff_datetime TIMESTAMP,
+                tip_amount DOUBLE
+            )
+        """
+        result = await duckdb_runner.execute_query(create_sql)
+        assert "error" not in result
+
+        inserted = insert_rows(duckdb_runner, "taxi_trips", sample_taxi_data)
+        assert inserted == len(sample_taxi_data)
+
+        result = await duckdb_runner.execute_query("""
+            SELECT COUNT(*) as trips,
+                   ROUND(SUM(total_amount), 2) as revenue,
+                   COUNT(*) FILTER (WHERE tpep_dropoff_datetime < tpep_pickup_datetime) as backwards
+            FROM taxi_trips
+        """)
+
+        assert result["data"][0]["trips"] == len(sample_taxi_data)
+        assert result["data"][0]["revenue"] == pytest.approx(
+            sum(row["total_amount"] for row in sample_taxi_data)
+        )
+        assert result["data"][0]["backwards"] == 0
+
+    @pytest.mark.integration
+    @pytest.mark.requires_duckdb
+    async def test_duckdb_taxi_table_scan(self, duckdb_runner, sample_taxi_table, sample_taxi_data):
+        """Test querying the shared Arrow taxi table without copying it"""
+
+        duckdb_runner.connection.register("taxi_arrow", sample_taxi_table)
+        try:
+            result = await duckdb_runner.execute_query("""
+                SELECT payment_type, COUNT(*) as trips
+                FROM taxi_arrow
+                GROUP BY payment_type
+            """)
+        finally:
+            duckdb_runner.connection.unregister("taxi_arrow")
+
+        expected = {}
+        for row in sample_taxi_data:
+            expected[row["payment_type"]] = expected.get(row["payment_type"], 0) + 1
+
+        assert {row["payment_type"]: row["trips"] for row in result["data"]} == expected
+
+    @pytest.mark.integration
+    @pytest.mark.requires_duckdb
+    async def test_duckdb_user_events_ingestion(self, duckdb_runner, sample_user_events):
+        """Test inserting the shared user events and grouping them"""
+
+        create_sql = """
+            CREATE TABLE user_events (
+                user_id VARCHAR,
+                event_type VARCHAR,
+                timestamp BIGINT,
+                page_url VARCHAR,
+                session_id VARCHAR,
+                device_type VARCHAR
+            )
+        """
+        result = await duckdb_runner.execute_query(create_sql)
+        assert "error" not in result
+
+        rows = [
+            {**{key: event[key] for key in ("user_id", "event_type", "timestamp", "page_url", "session_id")},
+             "device_type": event["metadata"]["device_type"]}
+            for event in sample_user_events
+        ]
+        assert insert_rows(duckdb_runner, "user_events", rows) == len(sample_user_events)
+
+        result = await duckdb_runner.execute_query(
+            "SELECT device_type, COUNT(*) as events FROM user_events GROUP BY device_type"
+        )
+
+        expected = {}
+        for event in sample_user_events:
+            device = event["metadata"]["device_type"]
+            expected[device] = expected.get(device, 0) + 1
+
+        assert {row["device_type"]: row["events"] for row in result["data"]} == expected
+
+    @pytest.mark.integration
+    @pytest.mark.requires_duckdb
     async def test_duckdb_performance_with_large_dataset(self, duckdb_runner):
         """Test performance with larger dataset"""
         
@@ -178,7 +334,7 @@ class TestDuckDBIntegration:
         
         assert "error" not in result
         assert result["rows"] > 0
-        assert result["execution_time"] > 0
+        assert result["execution_time_ns"] > 0
         
         # Verify performance metrics scale appropriately
         metrics = result["performance_metrics"]
@@ -187,7 +343,6 @@ class TestDuckDBIntegration:
 
     @pytest.mark.integration
     @pytest.mark.requires_duckdb
-    @pytest.mark.asyncio
     async def test_duckdb_error_recovery(self, duckdb_runner):
         """Test error handling and recovery"""
         
@@ -209,7 +364,7 @@ class TestDuckDBIntegration:
 class TestClickHouseIntegration:
     """Integration tests for ClickHouseRunner with real database"""
 
-    @pytest.fixture
+    @pytest_asyncio.fixture
     async def clickhouse_runner(self):
         """Create and initialize a real ClickHouseRunner instance"""
         runner = ClickHouseRunner()
@@ -226,7 +381,6 @@ class TestClickHouseIntegration:
 
     @pytest.mark.integration
     @pytest.mark.requires_clickhouse
-    @pytest.mark.asyncio
     async def test_clickhouse_connection(self, clickhouse_runner):
         """Test ClickHouse connection and basic operations"""
         
@@ -242,7 +396,6 @@ class TestClickHouseIntegration:
 
     @pytest.mark.integration
     @pytest.mark.requires_clickhouse
-    @pytest.mark.asyncio
     async def test_clickhouse_sql_cleaning(self, clickhouse_runner):
         """Test SQL cleaning functionality with real execution"""
         
@@ -259,7 +412,6 @@ class TestClickHouseIntegration:
 
     @pytest.mark.integration
     @pytest.mark.requires_clickhouse
-    @pytest.mark.asyncio
     async def test_clickhouse_schema_operations(self, clickhouse_runner):
         """Test ClickHouse schema information retrieval"""
         
@@ -277,7 +429,6 @@ class TestClickHouseIntegration:
 
     @pytest.mark.integration
     @pytest.mark.requires_clickhouse
-    @pytest.mark.asyncio
     async def test_clickhouse_cluster_info(self, clickhouse_runner):
         """Test cluster information retrieval"""
         
@@ -291,7 +442,6 @@ class TestClickHouseIntegration:
 
     @pytest.mark.integration
     @pytest.mark.requires_clickhouse
-    @pytest.mark.asyncio
     async def test_clickhouse_query_validation(self, clickhouse_runner):
         """Test query validation with real ClickHouse"""
         
@@ -307,7 +457,6 @@ class TestClickHouseIntegration:
 
     @pytest.mark.integration
     @pytest.mark.requires_clickhouse
-    @pytest.mark.asyncio
     async def test_clickhouse_sample_data_queries(self, clickhouse_runner):
         """Test queries against sample data if available"""
         
@@ -324,7 +473,6 @@ class TestClickHouseIntegration:
 
     @pytest.mark.integration
     @pytest.mark.requires_clickhouse
-    @pytest.mark.asyncio
     async def test_clickhouse_performance_metrics(self, clickhouse_runner):
         """Test performance metrics collection"""
         
@@ -335,7 +483,7 @@ class TestClickHouseIntegration:
         
         metrics = result["performance_metrics"]
         assert metrics["engine"] == "clickhouse"
-        assert metrics["execution_time"] > 0
+        assert metrics["execution_time_ns"] > 0
         assert metrics["rows_processed"] == 10
         assert metrics["network_time"] >= 0  # ClickHouse includes network overhead
 
@@ -343,27 +491,25 @@ class TestClickHouseIntegration:
 class TestRunnerComparison:
     """Integration tests comparing DuckDB and ClickHouse runners"""
 
-    @pytest.fixture
-    async def both_runners(self, temp_db_path):
+    @pytest_asyncio.fixture
+    async def both_runners(self, pooled_duckdb_runner, clickhouse_available):
         """Setup both runners for comparison tests"""
-        duckdb_runner = DuckDBRunner(db_path=temp_db_path)
-        await duckdb_runner.initialize()
+        duckdb_runner = pooled_duckdb_runner
         
         clickhouse_runner = ClickHouseRunner()
-        try:
-            await clickhouse_runner.initialize()
-            clickhouse_available = clickhouse_runner.is_initialized
-        except Exception:
-            clickhouse_available = False
+        if clickhouse_available:
+            try:
+                await clickhouse_runner.initialize()
+                clickhouse_available = clickhouse_runner.is_initialized
+            except Exception:
+                clickhouse_available = False
         
         yield duckdb_runner, clickhouse_runner if clickhouse_available else None
         
-        await duckdb_runner.cleanup()
         if clickhouse_available:
             await clickhouse_runner.cleanup()
 
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_runner_performance_comparison(self, both_runners):
         """Compare performance characteristics between runners"""
         duckdb_runner, clickhouse_runner = both_runners
@@ -397,7 +543,6 @@ class TestRunnerComparison:
             assert duckdb_metrics["network_time"] == 0
 
     @pytest.mark.integration
-    @pytest.mark.asyncio
     async def test_query_validation_comparison(self, both_runners):
         """Compare query validation between runners"""
         duckdb_runner, clickhouse_runner = both_runners
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Statistical benchmarks for the Rust engine using pytest-benchmark
+
+Each query is measured over several calibrated rounds (with a warmup round)
+per data size, so results can be saved and compared across runs:
+
+    pytest tests/test_benchmark_engines.py -m slow --benchmark-save=rust_engine
+    pytest tests/test_benchmark_engines.py -m slow --benchmark-compare
+"""
+
+import pytest
+
+# Try to import Rust engine
+try:
+    import bigquery_lite_engine
+    RUST_ENGINE_AVAILABLE = True
+except ImportError:
+    RUST_ENGINE_AVAILABLE = False
+
+
+pytestmark = [
+    pytest.mark.slow,
+    pytest.mark.skipif(not RUST_ENGINE_AVAILABLE, reason="Rust engine not available"),
+]
+
+DATA_SIZES = [10_000, 100_000, 1_000_000]
+
+TEST_QUERIES = [
+    "SELECT COUNT(*) FROM test_data",
+    "SELECT category, COUNT(*) FROM test_data GROUP BY category",
+    "SELECT category, COUNT(*), AVG(value) FROM test_data GROUP BY category ORDER BY COUNT(*) DESC",
+    "SELECT * FROM test_data WHERE value > 500 ORDER BY value DESC LIMIT 100",
+    "SELECT category, MIN(value), MAX(value), AVG(value) FROM test_data GROUP BY category",
+]
+
+
+@pytest.fixture(scope="module", params=DATA_SIZES, ids=lambda size: f"{size}_rows")
+def sized_engine(request):
+    """Rust engine with `test_data` registered at the parametrized size"""
+    engine = bigquery_lite_engine.BlazeQueryEngine()
+    engine.register_test_data("test_data", request.param)
+    return request.param, engine
+
+
+@pytest.mark.parametrize("sql", TEST_QUERIES, ids=[f"q{i}" for i in range(1, len(TEST_QUERIES) + 1)])
+def test_rust_engine_query(benchmark, sized_engine, sql):
+    """Benchmark a single query against one data size"""
+    data_size, engine = sized_engine
+    benchmark.group = f"rust_engine-{data_size}_rows"
+    benchmark.extra_info["sql"] = sql
+
+    result = benchmark.pedantic(
+        engine.execute_query_sync,
+        args=(sql,),
+        iterations=5,
+        rounds=3,
+        warmup_rounds=1,
+    )
+
+    assert result.rows > 0
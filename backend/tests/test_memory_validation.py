@@ -8,9 +8,20 @@ memory under various usage patterns.
 
 import pytest
 import gc
-import time
+import mmap
+import sys
 import threading
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import resource
+except ImportError:
+    resource = None
 
 # Try to import Rust engine
 try:
@@ -20,27 +31,89 @@ except ImportError:
     RUST_ENGINE_AVAILABLE = False
 
 
+@pytest.fixture(scope="module")
+def engine():
+    """Engine shared by every test in this module; tests use unique table names"""
+    return bigquery_lite_engine.BlazeQueryEngine()
+
+
+@pytest.fixture(scope="module")
+def pool():
+    """Worker threads shared by the concurrent tests in this module"""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        yield executor
+
+
+@pytest.fixture
+def fresh_engine():
+    """Dedicated engine for tests that measure per-engine growth"""
+    return bigquery_lite_engine.BlazeQueryEngine()
+
+
 def get_memory_usage():
-    """Get approximate memory usage in bytes (simplified)"""
+    """Get the process's current resident memory in bytes
+    
+    Reads /proc/self/statm on Linux and psutil elsewhere. Only when neither is
+    available does it fall back to ru_maxrss, which is the peak RSS and never
+    decreases, so leaks below an earlier high-water mark go unseen.
+    """
     try:
-        import psutil
-        import os
-        process = psutil.Process(os.getpid())
-        return process.memory_info().rss
-    except ImportError:
-        return 0  # psutil not available
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * mmap.PAGESIZE
+    except OSError:
+        pass
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    if resource is None:
+        return 0  # getrusage not available (Windows)
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes on Linux
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+
+def wait_for_stable_memory(tolerance_bytes=1 << 20, max_iters=10):
+    """Collect garbage until RSS settles within tolerance, then return it"""
+    prev = cur = get_memory_usage()
+    for _ in range(max_iters):
+        gc.collect()
+        cur = get_memory_usage()
+        if abs(cur - prev) < tolerance_bytes:
+            return cur
+        prev = cur
+    return cur
+
+
+# Whether get_memory_usage can see memory being returned (not just the peak)
+CURRENT_RSS_AVAILABLE = sys.platform.startswith("linux") or psutil is not None
+
+
+@pytest.mark.skipif(not CURRENT_RSS_AVAILABLE, reason="Current RSS not readable on this platform")
+def test_wait_for_stable_memory_converges_after_free():
+    """Test that the settle helper reports memory released by garbage collection"""
+    block_bytes = 64 << 20
+    baseline = wait_for_stable_memory()
+    
+    # Only the cycle collector can free this block, so the helper's gc.collect must run
+    holder = {"block": b"\x01" * block_bytes}
+    holder["self"] = holder
+    held = get_memory_usage()
+    assert held - baseline > block_bytes // 2
+    
+    del holder
+    settled = wait_for_stable_memory()
+    assert held - settled > block_bytes // 2, \
+        f"Memory did not settle after free: {held / 2**20:.0f}MB -> {settled / 2**20:.0f}MB"
 
 
 @pytest.mark.skipif(not RUST_ENGINE_AVAILABLE, reason="Rust engine not available")
 class TestMemoryEfficiency:
     """Test memory efficiency and usage patterns"""
     
-    def test_basic_memory_reporting(self):
+    def test_basic_memory_reporting(self, engine, table_name):
         """Test that memory usage is reported correctly"""
-        engine = bigquery_lite_engine.BlazeQueryEngine()
-        engine.register_test_data("memory_basic", 10_000)
+        engine.register_test_data(table_name, 10_000)
         
-        result = engine.execute_query_sync("SELECT COUNT(*) FROM memory_basic")
+        result = engine.execute_query_sync(f"SELECT COUNT(*) FROM {table_name}")
         
         # Memory usage should be reported
         assert result.memory_used_bytes >= 0
@@ -49,16 +122,14 @@ class TestMemoryEfficiency:
         memory_mb = result.memory_used_bytes / 1024 / 1024
         assert memory_mb < 100, f"Memory usage {memory_mb:.2f}MB too high for 10K rows"
     
-    def test_memory_scaling_with_data_size(self):
+    def test_memory_scaling_with_data_size(self, engine, table_name):
         """Test that memory usage scales reasonably with data size"""
-        engine = bigquery_lite_engine.BlazeQueryEngine()
-        
         memory_usages = []
         data_sizes = [1_000, 10_000, 50_000]
         
         for size in data_sizes:
-            engine.register_test_data(f"memory_scale_{size}", size)
-            result = engine.execute_query_sync(f"SELECT COUNT(*) FROM memory_scale_{size}")
+            engine.register_test_data(f"{table_name}_{size}", size)
+            result = engine.execute_query_sync(f"SELECT COUNT(*) FROM {table_name}_{size}")
             memory_usages.append((size, result.memory_used_bytes))
         
         # Memory should scale sub-linearly with data size
@@ -73,13 +144,18 @@ class TestMemoryEfficiency:
             assert memory_ratio < data_ratio * 2, \
                 f"Memory scales poorly: {memory_ratio:.1f}x memory for {data_ratio}x data"
     
-    def test_large_dataset_memory_target(self):
-        """Test memory usage target for large datasets"""
-        engine = bigquery_lite_engine.BlazeQueryEngine()
-        engine.register_test_data("memory_large", 1_000_000)
-        
-        # Complex aggregation on 1M rows
-        result = engine.execute_query_sync("""
+    @pytest.mark.serial
+    @pytest.mark.xdist_group("memory_heavy")
+    @pytest.mark.parametrize("n_rows,target_gb", [
+        (100_000, 0.2),
+        pytest.param(1_000_000, 2.0, marks=pytest.mark.slow),
+    ])
+    def test_large_dataset_memory_target(self, engine, table_name, n_rows, target_gb):
+        """Test memory usage target for large datasets (1M rows only in slow runs)"""
+        engine.register_test_data(table_name, n_rows)
+        
+        # Complex aggregation over the whole table
+        result = engine.execute_query_sync(f"""
             SELECT 
                 category,
                 COUNT(*) as count,
@@ -87,28 +163,28 @@ class TestMemoryEfficiency:
                 AVG(value) as average,
                 MIN(value) as minimum,
                 MAX(value) as maximum
-            FROM memory_large 
+            FROM {table_name} 
             GROUP BY category
         """)
         
-        # Primary target: under 2GB memory usage
+        # Primary target: memory usage scales with the data size
         memory_gb = result.memory_used_bytes / 1024 / 1024 / 1024
-        assert memory_gb < 2.0, f"Memory usage {memory_gb:.3f}GB exceeds 2GB target"
+        assert memory_gb < target_gb, f"Memory usage {memory_gb:.3f}GB exceeds {target_gb}GB target"
         
-        # Should also be reasonably efficient
+        # Should also be reasonably efficient (500MB per 1M rows)
         memory_mb = result.memory_used_bytes / 1024 / 1024
-        assert memory_mb < 500, f"Memory usage {memory_mb:.2f}MB higher than expected for 1M rows"
+        budget_mb = target_gb * 250
+        assert memory_mb < budget_mb, f"Memory usage {memory_mb:.2f}MB higher than expected for {n_rows:,} rows"
     
-    def test_memory_cleanup_after_queries(self):
+    def test_memory_cleanup_after_queries(self, engine, table_name):
         """Test that memory is cleaned up after query execution"""
-        engine = bigquery_lite_engine.BlazeQueryEngine()
-        engine.register_test_data("memory_cleanup", 100_000)
+        engine.register_test_data(table_name, 100_000)
         
         # Run several memory-intensive queries
         queries = [
-            "SELECT * FROM memory_cleanup ORDER BY value DESC LIMIT 10000",
-            "SELECT category, COUNT(*), AVG(value) FROM memory_cleanup GROUP BY category",
-            "SELECT * FROM memory_cleanup WHERE value > 750",
+            f"SELECT * FROM {table_name} ORDER BY value DESC LIMIT 10000",
+            f"SELECT category, COUNT(*), AVG(value) FROM {table_name} GROUP BY category",
+            f"SELECT * FROM {table_name} WHERE value > 750",
         ]
         
         peak_memories = []
@@ -126,30 +202,27 @@ class TestMemoryEfficiency:
 
 
 @pytest.mark.skipif(not RUST_ENGINE_AVAILABLE, reason="Rust engine not available")
+@pytest.mark.skipif(not CURRENT_RSS_AVAILABLE, reason="Current RSS not readable on this platform")
 class TestMemoryLeaks:
     """Test for memory leaks under various usage patterns"""
     
-    def test_repeated_queries_no_leak(self):
+    @pytest.mark.serial
+    @pytest.mark.xdist_group("memory_heavy")
+    def test_repeated_queries_no_leak(self, engine, table_name):
         """Test that repeated queries don't cause memory leaks"""
-        engine = bigquery_lite_engine.BlazeQueryEngine()
-        engine.register_test_data("leak_test", 10_000)
+        engine.register_test_data(table_name, 10_000)
         
-        query = "SELECT category, COUNT(*) FROM leak_test GROUP BY category"
+        query = f"SELECT category, COUNT(*) FROM {table_name} GROUP BY category"
         
         # Record initial memory
         initial_memory = get_memory_usage()
         
-        # Run many queries
-        for i in range(100):
-            result = engine.execute_query_sync(query)
-            assert result.rows == 10  # Verify query works
+        # Run many queries inside the engine (no Python round trip per run)
+        result = engine.execute_query_sync_n(query, 100)
+        assert result.rows == 10  # Verify query works
         
-        # Force garbage collection
-        gc.collect()
-        time.sleep(0.1)  # Allow cleanup
-        
-        # Check final memory
-        final_memory = get_memory_usage()
+        # Force garbage collection and check final memory once it settles
+        final_memory = wait_for_stable_memory()
         
         if initial_memory > 0 and final_memory > 0:
             memory_growth = final_memory - initial_memory
@@ -159,25 +232,18 @@ class TestMemoryLeaks:
             assert memory_growth_mb < 50, \
                 f"Potential memory leak: {memory_growth_mb:.2f}MB growth after 100 queries"
     
-    def test_table_registration_no_leak(self):
+    def test_table_registration_no_leak(self, fresh_engine):
         """Test that registering multiple tables doesn't leak memory"""
-        engine = bigquery_lite_engine.BlazeQueryEngine()
-        
         initial_memory = get_memory_usage()
         
-        # Register many small tables
-        for i in range(20):
-            engine.register_test_data(f"table_{i}", 1000)
+        # Register many small tables in one engine call
+        fresh_engine.register_test_data_batch([f"table_{i}" for i in range(20)], 1000)
         
-        # Query each table
+        # Count each table
         for i in range(20):
-            result = engine.execute_query_sync(f"SELECT COUNT(*) FROM table_{i}")
-            assert result.rows == 1
-        
-        gc.collect()
-        time.sleep(0.1)
+            assert fresh_engine.count_table(f"table_{i}") == 1000
         
-        final_memory = get_memory_usage()
+        final_memory = wait_for_stable_memory()
         
         if initial_memory > 0 and final_memory > 0:
             memory_growth = final_memory - initial_memory
@@ -187,30 +253,26 @@ class TestMemoryLeaks:
             assert memory_growth_mb < 100, \
                 f"Excessive memory growth: {memory_growth_mb:.2f}MB for 20 small tables"
     
-    def test_concurrent_queries_memory(self):
+    def test_concurrent_queries_memory(self, engine, table_name, pool):
         """Test memory usage under concurrent query load"""
-        engine = bigquery_lite_engine.BlazeQueryEngine()
-        engine.register_test_data("concurrent_memory", 50_000)
+        engine.register_test_data(table_name, 50_000)
         
         def run_query(query_id):
-            query = f"SELECT COUNT(*) FROM concurrent_memory WHERE value > {query_id * 100}"
+            query = f"SELECT COUNT(*) FROM {table_name} WHERE value > {query_id * 100}"
             result = engine.execute_query_sync(query)
             return result.memory_used_bytes
         
         initial_memory = get_memory_usage()
         
-        # Run queries concurrently
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(run_query, i) for i in range(20)]
-            memory_usages = [future.result() for future in futures]
-        
-        gc.collect()
-        time.sleep(0.1)
-        
-        final_memory = get_memory_usage()
+        # Run queries concurrently; all should complete successfully
+        futures = [pool.submit(run_query, i) for i in range(20)]
+        completed = 0
+        for future in as_completed(futures):
+            assert future.result() >= 0
+            completed += 1
+        assert completed == 20
         
-        # All queries should complete successfully
-        assert all(mem >= 0 for mem in memory_usages)
+        final_memory = wait_for_stable_memory()
         
         # Memory shouldn't grow excessively
         if initial_memory > 0 and final_memory > 0:
@@ -225,14 +287,13 @@ class TestMemoryLeaks:
 class TestMemoryPressure:
     """Test behavior under memory pressure"""
     
-    def test_large_result_set_memory(self):
+    def test_large_result_set_memory(self, engine, table_name):
         """Test memory usage for queries returning large result sets"""
-        engine = bigquery_lite_engine.BlazeQueryEngine()
-        engine.register_test_data("large_results", 100_000)
+        engine.register_test_data(table_name, 100_000)
         
         # Query that returns many rows
         result = engine.execute_query_sync(
-            "SELECT id, value, category FROM large_results WHERE value > 200 LIMIT 50000"
+            f"SELECT id, value, category FROM {table_name} WHERE value > 200 LIMIT 50000"
         )
         
         # Should handle large result sets efficiently
@@ -246,13 +307,12 @@ class TestMemoryPressure:
         # Total memory should still be reasonable
         assert memory_mb < 500, f"Memory usage {memory_mb:.2f}MB too high for result set"
     
-    def test_complex_query_memory(self):
+    def test_complex_query_memory(self, engine, table_name):
         """Test memory usage for complex multi-step queries"""
-        engine = bigquery_lite_engine.BlazeQueryEngine()
-        engine.register_test_data("complex_memory", 50_000)
+        engine.register_test_data(table_name, 50_000)
         
         # Complex query with multiple operations
-        result = engine.execute_query_sync("""
+        result = engine.execute_query_sync(f"""
             SELECT 
                 category,
                 COUNT(*) as total_count,
@@ -260,7 +320,7 @@ class TestMemoryPressure:
                 SUM(CASE WHEN value > 500 THEN 1 ELSE 0 END) as high_value_count,
                 MIN(value) as min_value,
                 MAX(value) as max_value
-            FROM complex_memory 
+            FROM {table_name} 
             GROUP BY category 
             HAVING COUNT(*) > 1000
             ORDER BY avg_value DESC
@@ -274,16 +334,15 @@ class TestMemoryPressure:
         assert result.execution_time_ms < 1000, \
             f"Complex query took {result.execution_time_ms}ms, too slow"
     
-    def test_memory_stats_accuracy(self):
+    def test_memory_stats_accuracy(self, engine, table_name):
         """Test that reported memory statistics are accurate"""
-        engine = bigquery_lite_engine.BlazeQueryEngine()
-        engine.register_test_data("stats_accuracy", 10_000)
+        engine.register_test_data(table_name, 10_000)
         
         # Run several queries and track memory stats
         queries = [
-            "SELECT COUNT(*) FROM stats_accuracy",
-            "SELECT category, COUNT(*) FROM stats_accuracy GROUP BY category",
-            "SELECT * FROM stats_accuracy LIMIT 1000",
+            f"SELECT COUNT(*) FROM {table_name}",
+            f"SELECT category, COUNT(*) FROM {table_name} GROUP BY category",
+            f"SELECT * FROM {table_name} LIMIT 1000",
         ]
         
         reported_memories = []
@@ -6,12 +6,16 @@ These tests validate that the Rust engine meets performance targets and
 doesn't regress over time.
 """
 
+import os
+import re
 import pytest
 import time
-import statistics
 import asyncio
 from typing import List, Dict, Any
 
+import numpy as np
+import pyarrow as pa
+
 from runners.duckdb_runner import DuckDBRunner
 
 # Try to import Rust engine
@@ -21,37 +25,132 @@ try:
 except ImportError:
     RUST_ENGINE_AVAILABLE = False
 
+# Fixed seed so every run benchmarks byte-identical data
+DATA_SEED = 12345
+
+# Numba is optional; without it every baseline query goes through DuckDB
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Aggregations the baseline computes directly on the NumPy columns, so the
+# speedup compares engines rather than DuckDB's per-query parse/plan cost
+ORACLE_QUERIES = frozenset({
+    "SELECT COUNT(*) FROM test_data",
+    "SELECT category, COUNT(*) FROM test_data GROUP BY category",
+    "SELECT category, COUNT(*), AVG(value) FROM test_data GROUP BY category",
+})
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _group_count_sum_njit(values, cats):
+        """Single-pass per-category COUNT and SUM over the 10 benchmark categories"""
+        counts = np.zeros(10, np.int64)
+        sums = np.zeros(10, np.float64)
+        for i in range(values.size):
+            c = cats[i]
+            counts[c] += 1
+            sums[c] += values[i]
+        return counts, sums
+
+
+@pytest.fixture(scope="session")
+def rust_engine():
+    """Engine shared by the benchmark tests so each dataset is generated once
+
+    Under pytest-xdist every worker gets its own engine (and Tokio runtime),
+    created here on first use rather than at import.
+    """
+    if not RUST_ENGINE_AVAILABLE:
+        pytest.skip("Rust engine not available")
+    return bigquery_lite_engine.BlazeQueryEngine()
+
+
+@pytest.fixture(scope="session")
+def shared_table(rust_engine):
+    """Return the name of a `rows`-row table on `rust_engine`, registering each size once"""
+    registered = {}
+    
+    def table_for(rows: int) -> str:
+        if rows not in registered:
+            registered[rows] = f"shared_{rows}"
+            rust_engine.register_test_data(registered[rows], rows)
+        return registered[rows]
+    
+    return table_for
+
 
 class PerformanceBenchmark:
     """Helper class for running performance benchmarks"""
     
     @staticmethod
-    async def benchmark_python_engine(queries: List[str], data_size: int) -> List[Dict[str, Any]]:
-        """Benchmark Python DuckDB engine"""
+    def check_oracle(connection, counts: np.ndarray, sums: np.ndarray):
+        """Assert the Numba oracle's per-category counts and sums match DuckDB on `perf_test`"""
+        expected = {
+            name: (count, total)
+            for name, count, total in connection.execute(
+                "SELECT CAST(category AS VARCHAR), COUNT(*), SUM(value) FROM perf_test GROUP BY category"
+            ).fetchall()
+        }
+        actual = {f"category_{i}": (int(counts[i]), float(sums[i])) for i in np.flatnonzero(counts)}
+        
+        assert actual.keys() == expected.keys()
+        for name, (count, total) in actual.items():
+            assert count == expected[name][0], f"{name}: oracle count {count} != DuckDB {expected[name][0]}"
+            assert total == pytest.approx(expected[name][1], rel=1e-9), f"{name}: oracle sum differs from DuckDB"
+    
+    @staticmethod
+    async def benchmark_python_engine(queries: List[str], data_size: int, use_oracle: bool = True) -> List[Dict[str, Any]]:
+        """Benchmark Python DuckDB engine
+        
+        With `use_oracle`, ORACLE_QUERIES are timed as a Numba loop over the
+        NumPy columns (checked against DuckDB) instead of going through SQL.
+        """
         runner = DuckDBRunner()
         await runner.initialize()
         
-        # Create test data
-        await runner.execute_query(f"""
-            CREATE TABLE perf_test AS 
-            SELECT 
-                row_number() OVER () as id,
-                random() * 1000 as value,
-                'category_' || (random() * 10)::int as category
-            FROM range({data_size})
-        """)
+        # Build test data in NumPy and register the Arrow table zero-copy
+        rng = np.random.default_rng(DATA_SEED)
+        cats = rng.integers(0, 10, data_size, dtype=np.int32)
+        values = rng.random(data_size) * 1000
+        runner.connection.register("perf_test", pa.table({
+            "id": np.arange(data_size, dtype=np.int64),
+            "value": values,
+            "category": pa.DictionaryArray.from_arrays(cats, pa.array([f"category_{i}" for i in range(10)])),
+        }))
+        
+        oracle = [query for query in queries if use_oracle and NUMBA_AVAILABLE and query in ORACLE_QUERIES]
+        if oracle:
+            _group_count_sum_njit(values[:1], cats[:1])  # Compile (or load the cache) outside the timing
+        
+        # Run the remaining queries in one batch; each result carries its own timing
+        sql_queries = [query for query in queries if query not in oracle]
+        batch = await runner.execute_many([query.replace("test_data", "perf_test") for query in sql_queries])
+        timings = {
+            query: (result["execution_time_ns"] / 1_000_000, result.get("rows", 0))  # Convert to ms
+            for query, result in zip(sql_queries, batch)
+        }
+        
+        for query in oracle:
+            start_ns = time.perf_counter_ns()
+            counts, sums = _group_count_sum_njit(values, cats)
+            elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+            timings[query] = (elapsed_ms, 1 if "GROUP BY" not in query else int(np.count_nonzero(counts)))
+        
+        if oracle:
+            PerformanceBenchmark.check_oracle(runner.connection, counts, sums)
         
         results = []
         for query in queries:
-            start_time = time.time()
-            result = await runner.execute_query(query.replace("test_data", "perf_test"))
-            execution_time = (time.time() - start_time) * 1000  # Convert to ms
-            
+            execution_time_ms, rows = timings[query]
             results.append({
                 "query": query,
-                "execution_time_ms": execution_time,
-                "rows": result.get("rows", 0),
-                "engine": "python_duckdb"
+                "execution_time_ms": execution_time_ms,
+                "rows": rows,
+                "engine": "numba_oracle" if query in oracle else "python_duckdb"
             })
         
         await runner.cleanup()
@@ -66,12 +165,13 @@ class PerformanceBenchmark:
         engine = bigquery_lite_engine.BlazeQueryEngine()
         engine.register_test_data("test_data", data_size)
         
+        # One FFI call for the whole batch
+        start_ns = time.perf_counter_ns()
+        batch = engine.execute_many_sync(queries)
+        total_time = (time.perf_counter_ns() - start_ns) / 1_000_000 / len(queries)  # Mean ms per query
+        
         results = []
-        for query in queries:
-            start_time = time.time()
-            result = engine.execute_query_sync(query)
-            total_time = (time.time() - start_time) * 1000  # Convert to ms
-            
+        for query, result in zip(queries, batch):
             results.append({
                 "query": query,
                 "execution_time_ms": result.execution_time_ms,
@@ -88,35 +188,33 @@ class PerformanceBenchmark:
 class TestPerformanceTargets:
     """Test that the Rust engine meets specific performance targets"""
     
-    def test_small_dataset_speed_target(self):
+    def test_small_dataset_speed_target(self, rust_engine, shared_table):
         """Test performance target for small datasets (1K rows)"""
-        engine = bigquery_lite_engine.BlazeQueryEngine()
-        engine.register_test_data("small_target", 1_000)
+        table = shared_table(1_000)
         
         # Simple aggregation should be very fast
-        result = engine.execute_query_sync("SELECT COUNT(*) FROM small_target")
+        result = rust_engine.execute_query_sync(f"SELECT COUNT(*) FROM {table}")
         assert result.execution_time_ms < 10  # Less than 10ms
         
         # GROUP BY should also be fast
-        result = engine.execute_query_sync(
-            "SELECT category, COUNT(*) FROM small_target GROUP BY category"
+        result = rust_engine.execute_query_sync(
+            f"SELECT category, COUNT(*) FROM {table} GROUP BY category"
         )
         assert result.execution_time_ms < 50  # Less than 50ms
     
-    def test_medium_dataset_speed_target(self):
+    def test_medium_dataset_speed_target(self, rust_engine, shared_table):
         """Test performance target for medium datasets (100K rows)"""
-        engine = bigquery_lite_engine.BlazeQueryEngine()
-        engine.register_test_data("medium_target", 100_000)
+        table = shared_table(100_000)
         
         # Complex aggregation should be reasonably fast
-        result = engine.execute_query_sync("""
+        result = rust_engine.execute_query_sync(f"""
             SELECT 
                 category, 
                 COUNT(*) as count,
                 AVG(value) as avg_value,
                 MIN(value) as min_value,
                 MAX(value) as max_value
-            FROM medium_target 
+            FROM {table} 
             GROUP BY category 
             ORDER BY count DESC
         """)
@@ -124,22 +222,25 @@ class TestPerformanceTargets:
         assert result.execution_time_ms < 100  # Less than 100ms
         assert result.rows == 10  # Should have 10 categories
     
-    def test_large_dataset_speed_target(self):
+    def test_large_dataset_speed_target(self, rust_engine, shared_table):
         """Test performance target for large datasets (1M rows) - THE KEY TEST"""
-        engine = bigquery_lite_engine.BlazeQueryEngine()
-        engine.register_test_data("large_target", 1_000_000)
+        table = shared_table(1_000_000)
         
         # This is the primary target: 1M+ row aggregations in <100ms
-        result = engine.execute_query_sync("""
+        result = rust_engine.execute_query_sync(f"""
             SELECT 
                 category, 
                 COUNT(*) as count,
                 SUM(value) as total_value,
                 AVG(value) as avg_value
-            FROM large_target 
+            FROM {table} 
             GROUP BY category
         """)
         
+        # Informational: with partial/final aggregation the budget should shrink with cores
+        scaled_budget_ms = 100 / max(1, (os.cpu_count() or 1) // 8)
+        print(f"1M-row GROUP BY: {result.execution_time_ms}ms (scaled budget {scaled_budget_ms:.1f}ms)")
+        
         # PRIMARY TARGET: Must complete in under 100ms
         assert result.execution_time_ms < 100, f"Failed target: {result.execution_time_ms}ms >= 100ms"
         assert result.rows == 10  # Should have 10 categories
@@ -148,23 +249,30 @@ class TestPerformanceTargets:
         memory_gb = result.memory_used_bytes / 1024 / 1024 / 1024
         assert memory_gb < 2.0, f"Memory usage {memory_gb:.3f}GB exceeds 2GB target"
     
-    def test_memory_efficiency_target(self):
+    def test_memory_efficiency_target(self, rust_engine, shared_table):
         """Test memory efficiency targets"""
-        engine = bigquery_lite_engine.BlazeQueryEngine()
-        engine.register_test_data("memory_target", 500_000)
-        
-        # Multiple complex queries to test memory management
-        queries = [
-            "SELECT COUNT(*) FROM memory_target",
-            "SELECT category, COUNT(*), AVG(value) FROM memory_target GROUP BY category",
-            "SELECT * FROM memory_target WHERE value > 750 ORDER BY value DESC LIMIT 100",
-            "SELECT category, MIN(value), MAX(value), SUM(value) FROM memory_target GROUP BY category",
-        ]
-        
+        table = shared_table(500_000)
+        
+        # Multiple complex queries to test memory management, with the columns each must scan
+        queries = {
+            f"SELECT COUNT(*) FROM {table}": set(),
+            f"SELECT category, COUNT(*), AVG(value) FROM {table} GROUP BY category": {"category", "value"},
+            f"SELECT * FROM {table} WHERE value > 750 ORDER BY value DESC LIMIT 100": {"id", "value", "category"},
+            f"SELECT category, MIN(value), MAX(value), SUM(value) FROM {table} GROUP BY category": {"category", "value"},
+        }
+        
+        # Projection pushdown: only referenced columns may be read from the table
+        for query, expected_columns in queries.items():
+            scan = re.search(r"TableScan: .*?projection=\[([^\]]*)\]", rust_engine.explain_sync(query))
+            assert scan, f"No projected TableScan in plan for: {query}"
+            scanned = {column.strip() for column in scan.group(1).split(",") if column.strip()}
+            assert scanned == expected_columns, f"Scan reads {sorted(scanned)} for: {query}"
+        
+        # Peak reservations come from the engine's memory pool high-water mark
         max_memory = 0
         for query in queries:
-            result = engine.execute_query_sync(query)
-            max_memory = max(max_memory, result.memory_used_bytes)
+            rust_engine.execute_query_sync_meta(query)
+            max_memory = max(max_memory, rust_engine.get_last_peak_bytes())
         
         # Memory usage should stay reasonable
         memory_mb = max_memory / 1024 / 1024
@@ -175,81 +283,84 @@ class TestPerformanceTargets:
 class TestPerformanceRegression:
     """Test for performance regressions over time"""
     
-    def test_execution_time_consistency(self):
+    def test_execution_time_consistency(self, rust_engine, shared_table):
         """Test that execution times are consistent across multiple runs"""
-        engine = bigquery_lite_engine.BlazeQueryEngine()
-        engine.register_test_data("consistency_test", 50_000)
+        table = shared_table(50_000)
+        
+        stmt = rust_engine.prepare(f"SELECT category, COUNT(*), AVG(value) FROM {table} GROUP BY category")
         
-        query = "SELECT category, COUNT(*), AVG(value) FROM consistency_test GROUP BY category"
+        # Warm up once (page faults, caches, branch predictors) outside the samples
+        warmup_time = stmt.execute().execution_time_ms
         
-        # Run the same query multiple times
-        times = []
-        for _ in range(10):
-            result = engine.execute_query_sync(query)
-            times.append(result.execution_time_ms)
+        # Run the same (pre-planned) query multiple times
+        times = np.empty(10)
+        for i in range(times.size):
+            times[i] = stmt.execute().execution_time_ms
         
         # Check consistency (coefficient of variation should be low)
-        mean_time = statistics.mean(times)
-        std_dev = statistics.stdev(times) if len(times) > 1 else 0
+        mean_time = float(times.mean())
+        std_dev = float(times.std(ddof=1))
         cv = std_dev / mean_time if mean_time > 0 else 0
         
         # For very fast queries (mean < 2ms), allow higher CV due to timing precision limitations
         cv_threshold = 5.0 if mean_time < 1.0 else 0.5
         assert cv < cv_threshold, f"Execution times too variable: CV={cv:.2f}, times={times}, mean={mean_time:.2f}ms"
         assert mean_time < 100, f"Mean execution time {mean_time:.2f}ms too slow"
+        
+        # A cold first run may be slower, but not by an order of magnitude
+        if mean_time >= 1.0:
+            assert warmup_time < 5 * mean_time, f"Warmup run {warmup_time}ms vs mean {mean_time:.2f}ms"
     
-    def test_memory_usage_consistency(self):
+    def test_memory_usage_consistency(self, rust_engine, shared_table):
         """Test that memory usage is consistent across runs"""
-        engine = bigquery_lite_engine.BlazeQueryEngine()
-        engine.register_test_data("memory_consistency", 100_000)
+        table = shared_table(100_000)
+        
+        stmt = rust_engine.prepare(f"SELECT category, COUNT(*), SUM(value) FROM {table} GROUP BY category")
         
-        query = "SELECT category, COUNT(*), SUM(value) FROM memory_consistency GROUP BY category"
+        stmt.execute()  # Warmup; first-run allocations are not representative
         
-        memory_usages = []
-        for _ in range(5):
-            result = engine.execute_query_sync(query)
-            memory_usages.append(result.memory_used_bytes)
+        memory_usages = np.empty(5)
+        for i in range(memory_usages.size):
+            memory_usages[i] = stmt.execute().memory_used_bytes
         
         # Memory usage should be relatively consistent
-        max_memory = max(memory_usages)
-        min_memory = min(memory_usages)
+        max_memory = float(memory_usages.max())
+        min_memory = float(memory_usages.min())
         
         if max_memory > 0:
             variation = (max_memory - min_memory) / max_memory
             assert variation < 0.2, f"Memory usage too variable: {memory_usages}"
     
-    def test_performance_scaling(self):
-        """Test that performance scales reasonably with data size"""
-        engine = bigquery_lite_engine.BlazeQueryEngine()
-        
-        sizes_and_times = []
-        
-        # Test different data sizes
-        for i, size in enumerate([1_000, 10_000, 100_000]):
-            table_name = f"scaling_test_{i}"
-            query = f"SELECT category, COUNT(*) FROM {table_name} GROUP BY category"
-            engine.register_test_data(table_name, size)
-            
-            result = engine.execute_query_sync(query)
-            sizes_and_times.append((size, result.execution_time_ms))
-        
-        # Performance should scale sub-linearly (better than O(n))
-        small_time = sizes_and_times[0][1]  # 1K rows
-        large_time = sizes_and_times[2][1]  # 100K rows
-        
-        # 100x more data should take less than 100x more time
-        if small_time > 0:
-            scaling_factor = large_time / small_time
-            data_scaling = 100  # 100K / 1K
+    def test_performance_scaling(self, rust_engine, shared_table):
+        """Test that the GROUP BY path scales no worse than linearly with data size"""
+        sizes = np.array([1_000, 10_000, 100_000, 1_000_000])
+        tables = [shared_table(int(size)) for size in sizes]  # Register every size before timing
+        
+        times = np.empty(sizes.size)
+        for i, table_name in enumerate(tables):
+            stmt = rust_engine.prepare(f"SELECT category, COUNT(*) FROM {table_name} GROUP BY category")
+            stmt.execute_meta()  # Warmup
             
-            assert scaling_factor < data_scaling, \
-                f"Performance scales poorly: {scaling_factor:.1f}x time for {data_scaling}x data"
+            # Best of three wall-clock runs; execution_time_ms is too coarse for the small sizes
+            samples = []
+            for _ in range(3):
+                start_ns = time.perf_counter_ns()
+                stmt.execute_meta()
+                samples.append(time.perf_counter_ns() - start_ns)
+            times[i] = min(samples)
+        
+        # Fit log(t) = a * log(N) + b; a > 1 means worse than linear (e.g. O(N log N) -> O(N^2))
+        slope, _ = np.polyfit(np.log(sizes), np.log(times), 1)
+        assert slope < 1.1, f"scaling exponent {slope:.2f} > 1.1 (times ns: {times.tolist()})"
 
 
-@pytest.mark.asyncio
 @pytest.mark.skipif(not RUST_ENGINE_AVAILABLE, reason="Rust engine not available")
 class TestComparativeBenchmarks:
-    """Compare Rust engine performance against Python baseline"""
+    """Compare Rust engine performance against Python baseline
+
+    The async baselines run on conftest's session loop, which is uvloop when
+    installed, so event-loop dispatch doesn't inflate the Python-side times.
+    """
     
     async def test_speedup_validation_small(self):
         """Validate speedup for small datasets"""
@@ -281,7 +392,7 @@ class TestComparativeBenchmarks:
         
         # For early-stage Rust engine, just verify it can complete queries successfully
         # Performance optimizations will come in future iterations
-        avg_speedup = statistics.mean(speedups) if speedups else 0
+        avg_speedup = float(np.mean(speedups)) if speedups else 0
         
         # Just verify both engines produce results (performance comparison is informational for now)
         assert len(speedups) > 0, "No valid speedup comparisons could be made"
@@ -297,45 +408,45 @@ class TestComparativeBenchmarks:
         
         data_size = 100_000  # Use 100K for reasonable test time
         
-        # Benchmark both engines
-        python_results = await PerformanceBenchmark.benchmark_python_engine(queries, data_size)
+        # Every baseline query goes through DuckDB SQL, so the asserted ratio
+        # compares parse, plan and execute on both sides
+        python_results = await PerformanceBenchmark.benchmark_python_engine(queries, data_size, use_oracle=False)
         rust_results = PerformanceBenchmark.benchmark_rust_engine(queries, data_size)
         
         assert len(rust_results) == len(python_results)
+        assert [r["rows"] for r in rust_results] == [r["rows"] for r in python_results]
         
-        # Calculate overall speedup
+        # Wall-clock time of the Rust batch, since execution_time_ms rounds
+        # fast queries down to 0ms
         total_python_time = sum(r["execution_time_ms"] for r in python_results)
-        total_rust_time = sum(r["execution_time_ms"] for r in rust_results)
+        total_rust_time = sum(r["total_time_ms"] for r in rust_results)
+        overall_speedup = total_python_time / total_rust_time
         
-        if total_rust_time > 0:
-            overall_speedup = total_python_time / total_rust_time
-            
-            # Should see significant speedup (targeting 10x, accept 3x+ as good)
-            assert overall_speedup > 3.0, f"Insufficient speedup: {overall_speedup:.2f}x"
-            
-            # If we hit 10x, that's excellent!
-            if overall_speedup >= 10.0:
-                print(f"🎯 EXCELLENT: Achieved {overall_speedup:.1f}x speedup (target: 10x)")
-            else:
-                print(f"✅ GOOD: Achieved {overall_speedup:.1f}x speedup (target: 10x)")
+        # Should see significant speedup (targeting 10x, accept 3x+ as good)
+        assert overall_speedup > 3.0, f"Insufficient speedup: {overall_speedup:.2f}x"
+        
+        # If we hit 10x, that's excellent!
+        if overall_speedup >= 10.0:
+            print(f"🎯 EXCELLENT: Achieved {overall_speedup:.1f}x speedup (target: 10x)")
+        else:
+            print(f"✅ GOOD: Achieved {overall_speedup:.1f}x speedup (target: 10x)")
 
 
 @pytest.mark.skipif(not RUST_ENGINE_AVAILABLE, reason="Rust engine not available")
 class TestStressTests:
     """Stress tests to validate robustness under load"""
     
-    def test_repeated_queries_stress(self):
+    def test_repeated_queries_stress(self, rust_engine, shared_table):
         """Test engine stability under repeated query load"""
-        engine = bigquery_lite_engine.BlazeQueryEngine()
-        engine.register_test_data("stress_test", 10_000)
+        table = shared_table(10_000)
         
-        query = "SELECT category, COUNT(*), AVG(value) FROM stress_test GROUP BY category"
+        stmt = rust_engine.prepare(f"SELECT category, COUNT(*), AVG(value) FROM {table} GROUP BY category")
         
         # Run many queries to test for memory leaks or degradation
-        execution_times = []
-        for i in range(50):
-            result = engine.execute_query_sync(query)
-            execution_times.append(result.execution_time_ms)
+        execution_times = np.empty(50)
+        for i in range(execution_times.size):
+            result = stmt.execute()
+            execution_times[i] = result.execution_time_ms
             
             # Verify result consistency
             assert result.rows == 10
@@ -345,30 +456,45 @@ class TestStressTests:
         early_times = execution_times[:10]
         late_times = execution_times[-10:]
         
-        early_avg = statistics.mean(early_times)
-        late_avg = statistics.mean(late_times)
+        early_avg = float(early_times.mean())
+        late_avg = float(late_times.mean())
         
         if early_avg > 0:
             degradation = late_avg / early_avg
             assert degradation < 2.0, f"Performance degraded {degradation:.1f}x over time"
     
-    def test_large_result_set_handling(self):
+    def test_large_result_set_handling(self, rust_engine, shared_table):
         """Test handling of queries that return large result sets"""
-        engine = bigquery_lite_engine.BlazeQueryEngine()
-        engine.register_test_data("large_result", 50_000)
+        table = shared_table(50_000)
+        
+        query = f"SELECT * FROM {table} WHERE value > 100 ORDER BY value LIMIT 5000"
         
         # Query that returns many rows
-        result = engine.execute_query_sync(
-            "SELECT * FROM large_result WHERE value > 100 ORDER BY value LIMIT 5000"
-        )
+        result = rust_engine.execute_query_sync_meta(query)
+        top_k_peak_bytes = rust_engine.get_last_peak_bytes()
         
         assert result.rows <= 5000
-        assert len(result.data) == result.rows
         assert result.execution_time_ms < 2000  # Should complete in reasonable time
         
         # Memory usage should be reasonable even for large results
         memory_mb = result.memory_used_bytes / 1024 / 1024
         assert memory_mb < 1000, f"Memory usage {memory_mb:.2f}MB too high for large result"
+        
+        # ORDER BY ... LIMIT must plan as TopK, holding ~5000 rows rather than sorting all 50K;
+        # the operator high-water mark must stay below that of the same sort without LIMIT
+        assert "TopK" in rust_engine.explain_sync(query)
+        rust_engine.execute_query_sync_meta(f"SELECT * FROM {table} WHERE value > 100 ORDER BY value")
+        full_sort_peak_bytes = rust_engine.get_last_peak_bytes()
+        assert 0 < top_k_peak_bytes < full_sort_peak_bytes, (
+            f"TopK peak {top_k_peak_bytes} bytes vs full sort {full_sort_peak_bytes} bytes "
+            "suggests LIMIT was not pushed into the sort"
+        )
+        
+        # The rows themselves come back columnar, without a dict per row
+        arrow_table = rust_engine.execute_query_arrow(query)
+        values = arrow_table.column("value").to_numpy()
+        assert arrow_table.num_rows == result.rows == values.size
+        assert (values > 100).all()
 
 
 if __name__ == "__main__":
@@ -15,23 +15,30 @@ from unittest.mock import Mock, patch, MagicMock
 import time
 
 from runners.duckdb_runner import DuckDBRunner
+from fixtures.sample_data import MockResponses
 
 
 class TestDuckDBRunner:
     """Test cases for DuckDBRunner class"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def runner(self, temp_db_path):
-        """Create a DuckDBRunner instance for testing"""
+        """One DuckDBRunner for the class, on the session database path"""
         return DuckDBRunner(db_path=temp_db_path)
 
+    @pytest.fixture(autouse=True)
+    def _reset_runner_state(self, runner):
+        """Return the shared runner to its uninitialized state after each test"""
+        yield
+        runner.connection = None
+        runner.is_initialized = False
+
     @pytest.fixture
     def initialized_runner(self, runner, mock_duckdb_connection):
-        """Create an initialized DuckDBRunner instance"""
-        with patch('runners.duckdb_runner.duckdb.connect', return_value=mock_duckdb_connection):
-            runner.connection = mock_duckdb_connection
-            runner.is_initialized = True
-            return runner
+        """The shared runner, marked initialized with the mock connection"""
+        runner.connection = mock_duckdb_connection
+        runner.is_initialized = True
+        return runner
 
     @pytest.mark.unit
     def test_runner_initialization(self, runner):
@@ -41,7 +48,6 @@ class TestDuckDBRunner:
         assert runner.is_initialized is False
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_initialize_success(self, runner, mock_duckdb_connection):
         """Test successful initialization"""
         with patch('runners.duckdb_runner.duckdb.connect', return_value=mock_duckdb_connection), \
@@ -58,7 +64,6 @@ class TestDuckDBRunner:
             mock_duckdb_connection.execute.assert_any_call("PRAGMA memory_limit='2GB'")
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_initialize_failure(self, runner):
         """Test initialization failure handling"""
         with patch('runners.duckdb_runner.duckdb.connect', side_effect=Exception("Connection failed")):
@@ -68,11 +73,10 @@ class TestDuckDBRunner:
             assert runner.is_initialized is False
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_execute_query_success(self, initialized_runner, sample_query_results):
+    async def test_execute_query_success(self, initialized_runner, query_result_rows):
         """Test successful query execution"""
         # Mock the fetchdf result
-        mock_df = pd.DataFrame(sample_query_results["simple_data"])
+        mock_df = pd.DataFrame(query_result_rows)
         
         # Create separate mocks for the three execute calls:
         # 1. PRAGMA profiling_output
@@ -84,7 +88,7 @@ class TestDuckDBRunner:
         
         # 3. EXPLAIN ANALYZE query
         explain_mock = Mock()
-        explain_mock.fetchall.return_value = [("Seq Scan on nyc_taxi",), ("Planning time: 0.1ms",)]
+        explain_mock.fetchall.return_value = [(line,) for line in MockResponses.query_explain_plan()]
         
         # Set up side_effect to return different mocks for different calls
         initialized_runner.connection.execute.side_effect = [pragma_mock, query_mock, explain_mock]
@@ -93,14 +97,13 @@ class TestDuckDBRunner:
         result = await initialized_runner.execute_query(sql)
         
         assert result["engine"] == "duckdb"
-        assert result["rows"] == 3
-        assert len(result["data"]) == 3
-        assert result["data"][0]["id"] == 1
-        assert result["execution_time"] > 0
+        assert result["rows"] == len(query_result_rows)
+        assert len(result["data"]) == len(query_result_rows)
+        assert result["data"][0] == dict(query_result_rows[0])
+        assert result["execution_time_ns"] > 0
         assert "performance_metrics" in result
 
     @pytest.mark.unit
-    @pytest.mark.asyncio  
     async def test_execute_query_with_nan_values(self, initialized_runner):
         """Test query execution with NaN values in results"""
         # Create DataFrame with NaN values
@@ -118,7 +121,6 @@ class TestDuckDBRunner:
         assert result["data"][1]["name"] is None
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_execute_query_error_handling(self, initialized_runner):
         """Test query execution error handling"""
         initialized_runner.connection.execute.side_effect = Exception("SQL syntax error")
@@ -129,10 +131,19 @@ class TestDuckDBRunner:
         assert result["rows"] == 0
         assert result["data"] == []
         assert "SQL syntax error" in result["error"]
-        assert result["execution_time"] > 0
+        assert result["execution_time_ns"] > 0
+
+    @pytest.mark.unit
+    async def test_execute_many(self, initialized_runner):
+        """Test executing a batch of queries returns one result per query, in order"""
+        initialized_runner.connection.execute.return_value.fetchdf.return_value = pd.DataFrame({"n": [1]})
+        
+        results = await initialized_runner.execute_many(["SELECT 1 AS n", "SELECT 1 AS n"])
+        
+        assert len(results) == 2
+        assert all(r["rows"] == 1 and r["data"] == [{"n": 1}] for r in results)
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_get_status_available(self, initialized_runner):
         """Test status check when runner is available"""
         initialized_runner.connection.execute.return_value.fetchone.return_value = (1,)
@@ -141,14 +152,12 @@ class TestDuckDBRunner:
         assert status == "available"
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_get_status_not_initialized(self, runner):
         """Test status check when not initialized"""
         status = await runner.get_status()
         assert status == "not_initialized"
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_get_status_error(self, initialized_runner):
         """Test status check when connection fails"""
         initialized_runner.connection.execute.side_effect = Exception("Connection error")
@@ -157,33 +166,27 @@ class TestDuckDBRunner:
         assert status == "error"
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_get_schema_info_success(self, initialized_runner):
         """Test successful schema information retrieval"""
-        # Mock tables result
         tables_result = Mock()
-        tables_result.fetchall.return_value = [("nyc_taxi", "BASE TABLE"), ("sample_data", "BASE TABLE")]
+        tables_result.fetchall.return_value = list(MockResponses.duckdb_table_info())
         
-        # Mock columns result
         columns_result = Mock()
-        columns_result.fetchall.return_value = [
-            ("id", "INTEGER"),
-            ("payment_type", "VARCHAR"),
-            ("fare_amount", "DOUBLE")
-        ]
+        columns_result.fetchall.return_value = list(MockResponses.duckdb_column_info())
         
-        initialized_runner.connection.execute.return_value = tables_result
-        # Alternate between tables and columns results
-        initialized_runner.connection.execute.side_effect = [tables_result, columns_result, columns_result]
+        # One tables query, then one columns query per table
+        initialized_runner.connection.execute.side_effect = (
+            [tables_result] + [columns_result] * len(MockResponses.duckdb_table_info())
+        )
         
         schema_info = await initialized_runner.get_schema_info()
         
         assert schema_info["engine"] == "duckdb"
         assert "tables" in schema_info
         assert "nyc_taxi" in schema_info["tables"]
+        assert len(schema_info["tables"]["nyc_taxi"]["columns"]) == len(MockResponses.duckdb_column_info())
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_get_schema_info_not_initialized(self, runner, mock_duckdb_connection):
         """Test schema info when not initialized - should auto-initialize"""
         with patch('runners.duckdb_runner.duckdb.connect', return_value=mock_duckdb_connection), \
@@ -198,8 +201,7 @@ class TestDuckDBRunner:
             assert schema_info["engine"] == "duckdb"
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
-    async def test_validate_query_valid_sql(self, initialized_runner):
+    async def test_validate_query_valid_sql(self, initialized_runner, sql_query):
         """Test query validation with valid SQL"""
         # Mock EXPLAIN result
         explain_result = Mock()
@@ -211,7 +213,7 @@ class TestDuckDBRunner:
         
         initialized_runner.connection.execute.side_effect = [explain_result, count_result]
         
-        validation = await initialized_runner.validate_query("SELECT * FROM nyc_taxi LIMIT 10")
+        validation = await initialized_runner.validate_query(sql_query)
         
         assert validation["valid"] is True
         assert validation["query_type"] == "SELECT"
@@ -220,7 +222,6 @@ class TestDuckDBRunner:
         assert "This query will process" in validation["suggestion"]
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_validate_query_invalid_sql(self, initialized_runner):
         """Test query validation with invalid SQL"""
         initialized_runner.connection.execute.side_effect = Exception("Syntax error")
@@ -233,7 +234,6 @@ class TestDuckDBRunner:
         assert validation["query_type"] == "OTHER"
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_validate_query_empty(self, initialized_runner):
         """Test query validation with empty query"""
         validation = await initialized_runner.validate_query("")
@@ -243,7 +243,6 @@ class TestDuckDBRunner:
         assert validation["query_type"] == "UNKNOWN"
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_validate_query_with_warnings(self, initialized_runner):
         """Test query validation generates appropriate warnings"""
         # Mock EXPLAIN result
@@ -265,55 +264,49 @@ class TestDuckDBRunner:
         assert "SELECT *" in warning_text
 
     @pytest.mark.unit
-    def test_get_query_type(self, runner):
+    @pytest.mark.parametrize("sql,expected_type", [
+        ("SELECT * FROM table", "SELECT"),
+        ("INSERT INTO table VALUES (1)", "INSERT"),
+        ("UPDATE table SET col=1", "UPDATE"),
+        ("DELETE FROM table", "DELETE"),
+        ("CREATE TABLE test (id int)", "CREATE"),
+        ("DROP TABLE test", "DROP"),
+        ("ALTER TABLE test ADD COLUMN", "ALTER"),
+        ("WITH cte AS (SELECT 1) SELECT * FROM cte", "WITH"),
+        ("UNKNOWN COMMAND", "OTHER")
+    ])
+    def test_get_query_type(self, runner, sql, expected_type):
         """Test query type detection"""
-        test_cases = [
-            ("SELECT * FROM table", "SELECT"),
-            ("INSERT INTO table VALUES (1)", "INSERT"),
-            ("UPDATE table SET col=1", "UPDATE"),
-            ("DELETE FROM table", "DELETE"),
-            ("CREATE TABLE test (id int)", "CREATE"),
-            ("DROP TABLE test", "DROP"),
-            ("ALTER TABLE test ADD COLUMN", "ALTER"),
-            ("WITH cte AS (SELECT 1) SELECT * FROM cte", "WITH"),
-            ("UNKNOWN COMMAND", "OTHER")
-        ]
-        
-        for sql, expected_type in test_cases:
-            assert runner._get_query_type(sql) == expected_type
+        assert runner._get_query_type(sql) == expected_type
 
     @pytest.mark.unit
-    def test_extract_table_names(self, runner):
+    @pytest.mark.parametrize("sql,expected_tables", [
+        ("SELECT * FROM users", ["users"]),
+        ("SELECT * FROM users JOIN orders ON users.id = orders.user_id", ["users", "orders"]),
+        ("INSERT INTO customers (name) VALUES ('John')", ["customers"]),
+        ("UPDATE products SET price = 100", ["products"]),
+        ("SELECT * FROM schema.table_name", ["schema"])  # Simple regex extracts schema part
+    ])
+    def test_extract_table_names(self, runner, sql, expected_tables):
         """Test table name extraction from SQL queries"""
-        test_cases = [
-            ("SELECT * FROM users", ["users"]),
-            ("SELECT * FROM users JOIN orders ON users.id = orders.user_id", ["users", "orders"]),
-            ("INSERT INTO customers (name) VALUES ('John')", ["customers"]),
-            ("UPDATE products SET price = 100", ["products"]),
-            ("SELECT * FROM schema.table_name", ["schema"])  # Simple regex extracts schema part
-        ]
-        
-        for sql, expected_tables in test_cases:
-            result = runner._extract_table_names(sql)
-            assert set(result) == set(expected_tables)
+        assert set(runner._extract_table_names(sql)) == set(expected_tables)
 
     @pytest.mark.unit
-    def test_estimate_execution_time(self, runner):
-        """Test execution time estimation"""
-        # Test simple query
+    @pytest.mark.parametrize("sql,estimated_rows", [
+        ("SELECT * FROM table", 10000),
+        ("SELECT * FROM table1 JOIN table2 ON table1.id = table2.id", 1000),
+        ("SELECT col, COUNT(*) FROM table GROUP BY col", 1000),
+        ("SELECT * FROM table ORDER BY col", 1000),
+        ("SELECT * FROM table1 JOIN table2 JOIN table3 GROUP BY col ORDER BY col2", 10000)
+    ])
+    def test_estimate_execution_time(self, runner, sql, estimated_rows):
+        """Test execution time estimation grows with data size and query complexity"""
         simple_time = runner._estimate_execution_time("SELECT * FROM table", 1000, "SELECT")
         assert simple_time >= 10  # Minimum time
         
-        # Test complex query with JOINs
-        complex_time = runner._estimate_execution_time(
-            "SELECT * FROM table1 JOIN table2 JOIN table3 GROUP BY col ORDER BY col2", 
-            10000, 
-            "SELECT"
-        )
-        assert complex_time > simple_time
+        assert runner._estimate_execution_time(sql, estimated_rows, "SELECT") > simple_time
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_cleanup(self, initialized_runner):
         """Test cleanup of resources"""
         # Store reference to mock connection before cleanup
@@ -326,7 +319,6 @@ class TestDuckDBRunner:
         assert initialized_runner.is_initialized is False
 
     @pytest.mark.unit
-    @pytest.mark.asyncio
     async def test_auto_initialization_on_execute(self, runner, mock_duckdb_connection):
         """Test that execute_query auto-initializes if not already initialized"""
         mock_df = pd.DataFrame([{"result": 1}])
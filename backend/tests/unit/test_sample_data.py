@@ -0,0 +1,200 @@
+"""
+Unit tests for the shared sample data generators
+
+Tests the fixtures in tests/fixtures/sample_data.py including:
+- Seeded determinism of the NYC taxi columns (NumPy and Numba paths)
+- Column types and value ranges of the NYC taxi table
+- Column types and value ranges of the user events
+- Read-only rows shared through the generator caches
+- Index-seeded sample performance metrics
+- Immutable query validation cases
+"""
+
+import dataclasses
+from datetime import datetime
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from fixtures import sample_data
+from fixtures.sample_data import SampleDataGenerator, ValidationTestCases
+
+
+pytestmark = [pytest.mark.unit]
+
+# Large enough to take the Numba path when Numba is installed
+_BULK_ROWS = sample_data.NUMBA_MIN_ROWS
+
+
+class TestTaxiColumns:
+    """Test cases for the NYC taxi column generator"""
+
+    @pytest.mark.parametrize("count", [100, _BULK_ROWS])
+    def test_same_seed_gives_identical_columns(self, count):
+        """Test that two draws with the same seed produce identical arrays"""
+        first = sample_data._taxi_columns(count, np.random.default_rng(1234))
+        second = sample_data._taxi_columns(count, np.random.default_rng(1234))
+
+        assert first.keys() == second.keys()
+        for name in first:
+            np.testing.assert_array_equal(first[name], second[name], err_msg=name)
+
+    @pytest.mark.skipif(not sample_data.NUMBA_AVAILABLE, reason="Numba not installed")
+    def test_numba_path_matches_numpy_path(self, monkeypatch):
+        """Test that the Numba kernel computes exactly what the NumPy fallback does"""
+        jitted = sample_data._taxi_columns(_BULK_ROWS, np.random.default_rng(99))
+        monkeypatch.setattr(sample_data, "NUMBA_AVAILABLE", False)
+        vectorized = sample_data._taxi_columns(_BULK_ROWS, np.random.default_rng(99))
+
+        for name in vectorized:
+            np.testing.assert_array_equal(jitted[name], vectorized[name], err_msg=name)
+
+    def test_seeded_table_is_reproducible(self):
+        """Test that the cached taxi table is keyed by seed"""
+        assert SampleDataGenerator.generate_nyc_taxi_table(50, seed=7).equals(
+            SampleDataGenerator.generate_nyc_taxi_table.__wrapped__(50, seed=7)
+        )
+
+
+class TestNycTaxiTable:
+    """Test cases for the columnar NYC taxi table"""
+
+    def test_column_types(self):
+        """Test that every column has the type the runners' sample tables use"""
+        table = SampleDataGenerator.generate_nyc_taxi_table(100, seed=1)
+
+        assert table.schema == pa.schema({
+            "id": pa.int64(),
+            "payment_type": pa.dictionary(pa.int8(), pa.string()),
+            "fare_amount": pa.float64(),
+            "trip_distance": pa.float64(),
+            "total_amount": pa.float64(),
+            "passenger_count": pa.int8(),
+            "tpep_pickup_datetime": pa.timestamp("s"),
+            "tpep_dropoff_datetime": pa.timestamp("s"),
+            "tip_amount": pa.float64()
+        })
+
+    def test_ids_and_categories(self):
+        """Test sequential ids and the allowed passenger counts and payment types"""
+        table = SampleDataGenerator.generate_nyc_taxi_table(500, seed=2)
+
+        assert table["id"].to_pylist() == list(range(1, 501))
+        assert set(table["passenger_count"].to_pylist()) <= set(range(1, 7))
+        assert set(table["payment_type"].to_pylist()) <= {"cash", "credit_card", "dispute", "no_charge"}
+
+    def test_money_and_distance_are_whole_cents(self):
+        """Test that cent draws become exact two-decimal dollar values in range"""
+        table = SampleDataGenerator.generate_nyc_taxi_table(1000, seed=4)
+        fare, tip, total, dist = (
+            table[name].to_numpy() for name in ("fare_amount", "tip_amount", "total_amount", "trip_distance")
+        )
+
+        for name, values in (("fare", fare), ("tip", tip), ("total", total), ("dist", dist)):
+            np.testing.assert_array_equal(np.round(values, 2), values, err_msg=name)
+
+        assert ((fare >= 5.0) & (fare <= 50.0)).all()
+        assert ((dist >= 0.5) & (dist <= 15.0)).all()
+        assert ((tip >= 0.0) & (tip <= np.round(fare * 0.3 + 0.01, 2))).all()
+        # The remainder is the 0.50-3.00 surcharge
+        extra = np.round(total - fare - tip, 2)
+        assert ((extra >= 0.5) & (extra <= 3.0)).all()
+
+    def test_trip_times(self):
+        """Test whole-minute pickups within days 0-365 and 5-120 minute trips"""
+        table = SampleDataGenerator.generate_nyc_taxi_table(1000, seed=5)
+        pickup = table["tpep_pickup_datetime"].to_numpy()
+        dropoff = table["tpep_dropoff_datetime"].to_numpy()
+        duration = (dropoff - pickup).astype("timedelta64[m]").astype(np.int64)
+
+        assert (pickup >= np.datetime64("2023-01-01")).all()
+        assert (pickup < np.datetime64("2024-01-02")).all()
+        assert (pickup.astype(np.int64) % 60 == 0).all()
+        assert ((duration >= 5) & (duration <= 120)).all()
+
+
+class TestUserEvents:
+    """Test cases for the user event generator"""
+
+    def test_dataframe_dtypes(self):
+        """Test the flat DataFrame's columns and dtypes"""
+        df = SampleDataGenerator.generate_user_events_df(200)
+
+        assert len(df) == 200
+        assert df["timestamp"].dtype == np.int64
+        assert df["is_premium"].dtype == np.bool_
+        for column in ("user_id", "event_type", "page_url", "session_id", "device_type", "browser", "location"):
+            assert all(isinstance(value, str) for value in df[column]), column
+
+    def test_value_ranges(self):
+        """Test prefixed ids and timestamps within January 2023"""
+        df = SampleDataGenerator.generate_user_events_df(200)
+        start = int(datetime(2023, 1, 1).timestamp())
+
+        assert df["user_id"].str.fullmatch(r"user_\d+").all()
+        assert df["page_url"].str.fullmatch(r"/page_\d+").all()
+        assert df["timestamp"].between(start, start + 31 * 86400 - 1).all()
+        assert set(df["event_type"]) <= {"click", "view", "purchase", "signup", "logout"}
+
+
+class TestCachedRows:
+    """Test cases for the cached, read-only row tuples"""
+
+    def test_taxi_rows_are_cached_and_read_only(self):
+        """Test that repeated calls share one tuple of read-only rows"""
+        rows = SampleDataGenerator.generate_nyc_taxi_data(20, seed=3)
+
+        assert rows is SampleDataGenerator.generate_nyc_taxi_data(20, seed=3)
+        with pytest.raises(TypeError):
+            rows[0]["fare_amount"] = 0.0
+
+    def test_user_event_rows_are_read_only(self):
+        """Test that event rows and their nested metadata reject writes"""
+        events = SampleDataGenerator.generate_user_events(10)
+
+        assert events is SampleDataGenerator.generate_user_events(10)
+        with pytest.raises(TypeError):
+            events[0]["event_type"] = "click"
+        with pytest.raises(TypeError):
+            events[0]["metadata"]["is_premium"] = True
+
+
+class TestSampleMetrics:
+    """Test cases for the index-seeded performance metrics"""
+
+    def test_same_index_gives_same_metrics(self):
+        """Test that metrics depend only on the index"""
+        metrics = SampleDataGenerator.generate_sample_metrics(7)
+
+        assert dict(metrics) == dict(SampleDataGenerator.generate_sample_metrics.__wrapped__(7))
+        assert dict(metrics) != dict(SampleDataGenerator.generate_sample_metrics(8))
+
+    def test_metrics_ranges_and_read_only(self):
+        """Test metric ranges and that the cached mapping rejects writes"""
+        metrics = SampleDataGenerator.generate_sample_metrics(0)
+
+        assert 0.01 <= metrics["execution_time"] <= 2.0
+        assert 0.1 <= metrics["memory_used_mb"] <= 100.0
+        assert 1 <= metrics["rows_processed"] <= 10000
+        assert isinstance(metrics["rows_processed"], int)
+        with pytest.raises(TypeError):
+            metrics["rows_processed"] = 0
+
+
+class TestValidationCases:
+    """Test cases for the shared query validation cases"""
+
+    def test_cases_are_frozen_and_slotted(self):
+        """Test that a shared case cannot be modified or extended"""
+        case = ValidationTestCases.get_validation_test_cases()[0]
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            case.expected_valid = False
+        assert not hasattr(case, "__dict__")
+
+    def test_case_names_are_unique(self):
+        """Test that every case has a distinct name for failure messages"""
+        names = [case.name for case in ValidationTestCases.get_validation_test_cases()]
+
+        assert len(names) == len(set(names))
@@ -1,6 +1,7 @@
 //! Core BlazeQueryEngine implementation using DataFusion
 
 use std::sync::Arc;
+use std::sync::atomic::{AtomicU64, AtomicUsize, Ordering};
 use std::collections::HashMap;
 use std::time::Instant;
 
@@ -9,9 +10,11 @@ use datafusion::execution::context::SessionConfig;
 use datafusion::execution::runtime_env::RuntimeEnvBuilder;
 use datafusion::datasource::MemTable;
 use datafusion::arrow::record_batch::RecordBatch;
-use datafusion::arrow::datatypes::Schema;
+use datafusion::arrow::datatypes::{Schema, SchemaRef};
 use datafusion::arrow::array::Array;
-use datafusion::execution::memory_pool::{GreedyMemoryPool, MemoryPool};
+use datafusion::execution::memory_pool::{GreedyMemoryPool, MemoryConsumer, MemoryPool, MemoryReservation};
+use datafusion::logical_expr::LogicalPlan;
+use datafusion::physical_plan::{collect, displayable};
 
 use tokio::sync::RwLock;
 use serde::{Deserialize, Serialize};
@@ -34,6 +37,9 @@ pub struct QueryResult {
     pub query_plan: Option<String>,
     /// Engine identifier
     pub engine: String,
+    /// Labels for dictionary-encoded columns returned as codes
+    /// (`ResultData::DictCodes`): a code in `data` indexes this column's list
+    pub dictionaries: HashMap<String, Vec<String>>,
 }
 
 /// Performance statistics for the engine
@@ -73,6 +79,112 @@ impl Default for EngineConfig {
     }
 }
 
+/// How much of a query's result to convert into `QueryResult::data`
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum ResultData {
+    /// Count rows only; `data` stays empty
+    RowCount,
+    /// Convert rows, returning dictionary-encoded columns as integer codes
+    /// into `QueryResult::dictionaries`
+    DictCodes,
+    /// Convert rows, resolving dictionary-encoded columns to their values
+    Decoded,
+}
+
+/// Result-wide label tables for dictionary columns returned as codes
+///
+/// Arrow dictionary keys only index their own batch's dictionary, and
+/// aggregation, repartitioning and sort-merge rebuild dictionaries freely, so
+/// keys are re-assigned against one label list per column for the whole result.
+#[derive(Debug, Default)]
+struct DictionaryLabels {
+    labels: HashMap<String, Vec<String>>,
+    codes: HashMap<String, HashMap<String, i64>>,
+}
+
+impl DictionaryLabels {
+    /// Result-wide code for each entry of one batch's dictionary
+    fn remap(&mut self, column: &str, values: &datafusion::arrow::array::StringArray) -> Vec<Option<i64>> {
+        let labels = self.labels.entry(column.to_string()).or_default();
+        let codes = self.codes.entry(column.to_string()).or_default();
+        (0..values.len())
+            .map(|i| {
+                if values.is_null(i) {
+                    return None;
+                }
+                let label = values.value(i);
+                Some(*codes.entry(label.to_string()).or_insert_with(|| {
+                    labels.push(label.to_string());
+                    (labels.len() - 1) as i64
+                }))
+            })
+            .collect()
+    }
+}
+
+/// Greedy memory pool that also records the high-water mark of reservations
+///
+/// Operators reserve memory as hash tables and sort buffers grow, so the peak
+/// captures transient growth that a before/after snapshot of `reserved()` misses.
+#[derive(Debug)]
+struct PeakMemoryPool {
+    inner: GreedyMemoryPool,
+    peak: AtomicUsize,
+}
+
+impl PeakMemoryPool {
+    fn new(limit: usize) -> Self {
+        Self {
+            inner: GreedyMemoryPool::new(limit),
+            peak: AtomicUsize::new(0),
+        }
+    }
+
+    /// Restart peak tracking from the current reservation, returning it
+    fn reset_peak(&self) -> usize {
+        let reserved = self.inner.reserved();
+        self.peak.store(reserved, Ordering::Relaxed);
+        reserved
+    }
+
+    fn peak(&self) -> usize {
+        self.peak.load(Ordering::Relaxed)
+    }
+
+    fn record_peak(&self) {
+        self.peak.fetch_max(self.inner.reserved(), Ordering::Relaxed);
+    }
+}
+
+impl MemoryPool for PeakMemoryPool {
+    fn register(&self, consumer: &MemoryConsumer) {
+        self.inner.register(consumer)
+    }
+
+    fn unregister(&self, consumer: &MemoryConsumer) {
+        self.inner.unregister(consumer)
+    }
+
+    fn grow(&self, reservation: &MemoryReservation, additional: usize) {
+        self.inner.grow(reservation, additional);
+        self.record_peak();
+    }
+
+    fn shrink(&self, reservation: &MemoryReservation, shrink: usize) {
+        self.inner.shrink(reservation, shrink)
+    }
+
+    fn try_grow(&self, reservation: &MemoryReservation, additional: usize) -> datafusion::error::Result<()> {
+        self.inner.try_grow(reservation, additional)?;
+        self.record_peak();
+        Ok(())
+    }
+
+    fn reserved(&self) -> usize {
+        self.inner.reserved()
+    }
+}
+
 /// High-performance query engine using DataFusion and Apache Arrow
 pub struct BlazeQueryEngine {
     /// DataFusion session context for SQL execution
@@ -82,7 +194,9 @@ pub struct BlazeQueryEngine {
     /// Performance statistics
     stats: Arc<RwLock<EngineStats>>,
     /// Memory pool for tracking usage
-    memory_pool: Arc<GreedyMemoryPool>,
+    memory_pool: Arc<PeakMemoryPool>,
+    /// Peak bytes reserved above the starting level during the last finished query
+    last_peak_bytes: AtomicU64,
 }
 
 impl BlazeQueryEngine {
@@ -97,7 +211,7 @@ impl BlazeQueryEngine {
               config.cpu_cores, config.memory_limit_bytes / 1024 / 1024);
 
         // Create memory pool with limit
-        let memory_pool = Arc::new(GreedyMemoryPool::new(config.memory_limit_bytes));
+        let memory_pool = Arc::new(PeakMemoryPool::new(config.memory_limit_bytes));
 
         // Configure runtime for optimal performance
         let runtime_env = RuntimeEnvBuilder::new()
@@ -124,48 +238,135 @@ impl BlazeQueryEngine {
             config,
             stats: Arc::new(RwLock::new(stats)),
             memory_pool,
+            last_peak_bytes: AtomicU64::new(0),
         })
     }
 
+    /// Number of partitions DataFusion plans scans and aggregations across
+    pub fn target_partitions(&self) -> usize {
+        self.config.cpu_cores.max(1)
+    }
+
     /// Execute a SQL query and return results with performance metrics
-    #[instrument(skip(self, sql), fields(sql_hash = %self.hash_sql(sql)))]
     pub async fn execute_query(&self, sql: &str) -> BlazeResult<QueryResult> {
+        self.run_query(sql, ResultData::Decoded).await
+    }
+
+    /// Execute a SQL query, converting only as much of the result as `data` asks for
+    pub async fn execute_query_as(&self, sql: &str, data: ResultData) -> BlazeResult<QueryResult> {
+        self.run_query(sql, data).await
+    }
+
+    /// Execute a SQL query and return only the row count and performance metrics
+    ///
+    /// Result batches are counted but never converted to JSON, so `data` is
+    /// left empty; use this when callers only need `rows` or the metrics.
+    pub async fn execute_query_meta(&self, sql: &str) -> BlazeResult<QueryResult> {
+        self.run_query(sql, ResultData::RowCount).await
+    }
+
+    /// Parse, plan and optimize a SQL query once so it can be executed repeatedly
+    pub async fn prepare(&self, sql: &str) -> BlazeResult<LogicalPlan> {
+        let ctx = self.ctx.read().await;
+        Ok(ctx.sql(sql).await?.into_optimized_plan()?)
+    }
+
+    /// Execute a plan from `prepare`, skipping SQL parsing and logical optimization
+    pub async fn execute_prepared(&self, plan: &LogicalPlan, data: ResultData) -> BlazeResult<QueryResult> {
+        let start_time = Instant::now();
+        let start_memory = self.memory_pool.reset_peak();
+        let query_plan = Self::debug_plan(plan);
+
+        // Only the physical plan is built per run; the logical plan is already optimized
+        let state = self.ctx.read().await.state();
+        let physical_plan = state.query_planner().create_physical_plan(plan, &state).await?;
+        let record_batches = collect(physical_plan, state.task_ctx()).await?;
+
+        self.finish_query(&record_batches, start_time, start_memory, query_plan, data).await
+    }
+
+    #[instrument(skip(self, sql), fields(sql_hash = %self.hash_sql(sql)))]
+    async fn run_query(&self, sql: &str, data: ResultData) -> BlazeResult<QueryResult> {
         let start_time = Instant::now();
-        let start_memory = self.memory_pool.reserved();
+        let start_memory = self.memory_pool.reset_peak();
 
         debug!("Executing query: {}", sql);
 
-        let ctx = self.ctx.read().await;
-        
         // Parse and plan the query
-        let logical_plan = ctx.sql(sql).await?;
-        
-        // Get query plan for debugging (optional)
-        let query_plan = if log::log_enabled!(log::Level::Debug) {
-            Some(format!("{}", logical_plan.logical_plan().display_indent_schema()))
-        } else {
-            None
+        let df = {
+            let ctx = self.ctx.read().await;
+            ctx.sql(sql).await?
         };
 
+        // Get query plan for debugging (optional)
+        let query_plan = Self::debug_plan(df.logical_plan());
+
         // Execute the query
-        let df = logical_plan;
         let record_batches = df.collect().await?;
 
+        self.finish_query(&record_batches, start_time, start_memory, query_plan, data).await
+    }
+
+    /// Execute a SQL query and return the Arrow result batches alongside the metrics
+    ///
+    /// `data` is left empty; callers consume the batches (and their schema,
+    /// which is also returned for empty results) directly.
+    pub async fn execute_query_batches(&self, sql: &str) -> BlazeResult<(QueryResult, SchemaRef, Vec<RecordBatch>)> {
+        let start_time = Instant::now();
+        let start_memory = self.memory_pool.reset_peak();
+
+        let df = {
+            let ctx = self.ctx.read().await;
+            ctx.sql(sql).await?
+        };
+        let query_plan = Self::debug_plan(df.logical_plan());
+        let schema: SchemaRef = Arc::new(df.schema().as_arrow().clone());
+
+        let record_batches = df.collect().await?;
+        let result = self.finish_query(&record_batches, start_time, start_memory, query_plan, ResultData::RowCount).await?;
+
+        Ok((result, schema, record_batches))
+    }
+
+    /// Format a logical plan for debugging when debug logging is enabled
+    fn debug_plan(plan: &LogicalPlan) -> Option<String> {
+        if log::log_enabled!(log::Level::Debug) {
+            Some(format!("{}", plan.display_indent_schema()))
+        } else {
+            None
+        }
+    }
+
+    /// Build the query result and update statistics from collected batches
+    async fn finish_query(
+        &self,
+        record_batches: &[RecordBatch],
+        start_time: Instant,
+        start_memory: usize,
+        query_plan: Option<String>,
+        result_data: ResultData,
+    ) -> BlazeResult<QueryResult> {
         // Convert results to JSON-serializable format
         let mut data = Vec::new();
         let mut total_rows = 0;
+        let mut dictionaries = DictionaryLabels::default();
 
-        for batch in &record_batches {
+        for batch in record_batches {
             total_rows += batch.num_rows();
-            let batch_data = self.record_batch_to_json(batch)?;
-            data.extend(batch_data);
+            if result_data != ResultData::RowCount {
+                let labels = (result_data == ResultData::DictCodes).then_some(&mut dictionaries);
+                let batch_data = self.record_batch_to_json(batch, labels)?;
+                data.extend(batch_data);
+            }
         }
 
         let execution_time = start_time.elapsed();
         let memory_used = self.memory_pool.reserved().saturating_sub(start_memory);
+        let peak_memory = self.memory_pool.peak().saturating_sub(start_memory) as u64;
+        self.last_peak_bytes.store(peak_memory, Ordering::Relaxed);
 
         // Update statistics
-        self.update_stats(execution_time.as_millis() as u64, memory_used as u64).await;
+        self.update_stats(execution_time.as_millis() as u64, peak_memory).await;
 
         let result = QueryResult {
             rows: total_rows,
@@ -174,6 +375,7 @@ impl BlazeQueryEngine {
             data,
             query_plan,
             engine: "blaze".to_string(),
+            dictionaries: dictionaries.labels,
         };
 
         info!("Query completed in {}ms, {} rows, {}MB memory", 
@@ -195,17 +397,76 @@ impl BlazeQueryEngine {
         let table = MemTable::try_new(schema, vec![batches])?;
         
         let ctx = self.ctx.write().await;
+        let replaced = ctx.deregister_table(name)?.is_some();
         ctx.register_table(name, Arc::new(table))?;
 
+        // Update stats; replacing a table does not add one
+        if !replaced {
+            let mut stats = self.stats.write().await;
+            stats.registered_tables += 1;
+        }
+
+        info!("Registered table '{}' with {} rows", name, total_rows);
+
+        Ok(())
+    }
+
+    /// Register an existing `MemTable` under several table names
+    ///
+    /// Every name shares the same `Arc`, so the data is held once however
+    /// many names (or callers) reference it. A name that is already
+    /// registered is replaced and not counted again.
+    pub async fn register_mem_table(&self, names: &[String], table: Arc<MemTable>) -> BlazeResult<()> {
+        let ctx = self.ctx.write().await;
+        let mut added = 0;
+        for name in names {
+            if ctx.deregister_table(name.as_str())?.is_none() {
+                added += 1;
+            }
+            ctx.register_table(name.as_str(), table.clone())?;
+        }
+
         // Update stats
         let mut stats = self.stats.write().await;
-        stats.registered_tables += 1;
+        stats.registered_tables += added;
 
-        info!("Registered table '{}' with {} rows", name, total_rows);
+        info!("Registered {} table(s) sharing one MemTable", names.len());
 
         Ok(())
     }
 
+    /// Deregister a table, returning whether it was previously registered
+    pub async fn deregister_table(&self, name: &str) -> BlazeResult<bool> {
+        let ctx = self.ctx.write().await;
+        let removed = ctx.deregister_table(name)?.is_some();
+
+        if removed {
+            // Update stats
+            let mut stats = self.stats.write().await;
+            stats.registered_tables = stats.registered_tables.saturating_sub(1);
+
+            info!("Deregistered table '{}'", name);
+        }
+
+        Ok(removed)
+    }
+
+    /// Count the rows of a registered table without parsing SQL
+    pub async fn count_rows(&self, name: &str) -> BlazeResult<usize> {
+        let ctx = self.ctx.read().await;
+        let df = ctx.table(name).await?;
+        Ok(df.count().await?)
+    }
+
+    /// Peak memory reserved by DataFusion operators during the last finished query
+    ///
+    /// Measured from the pool's high-water mark, so it includes transient
+    /// growth (e.g. hash table resizes) released before the query returned.
+    /// Queries running concurrently share the pool and count toward each other's peak.
+    pub fn last_peak_bytes(&self) -> u64 {
+        self.last_peak_bytes.load(Ordering::Relaxed)
+    }
+
     /// Get current engine statistics
     pub async fn get_stats(&self) -> EngineStats {
         self.stats.read().await.clone()
@@ -233,10 +494,47 @@ impl BlazeQueryEngine {
         }
     }
 
+    /// Plan a SQL query and render its optimized logical and physical plans without executing it
+    ///
+    /// The logical section shows the columns each `TableScan` projects; the
+    /// physical section shows operator choices such as `TopK`.
+    pub async fn explain(&self, sql: &str) -> BlazeResult<String> {
+        let df = {
+            let ctx = self.ctx.read().await;
+            ctx.sql(sql).await?
+        };
+        let logical_plan = df.clone().into_optimized_plan()?;
+        let physical_plan = df.create_physical_plan().await?;
+        Ok(format!(
+            "logical_plan\n{}\nphysical_plan\n{}",
+            logical_plan.display_indent(),
+            displayable(physical_plan.as_ref()).indent(true),
+        ))
+    }
+
     /// Convert RecordBatch to JSON-serializable format (simplified)
-    fn record_batch_to_json(&self, batch: &RecordBatch) -> BlazeResult<Vec<HashMap<String, serde_json::Value>>> {
+    ///
+    /// With `labels`, dictionary columns are emitted as result-wide codes into
+    /// those label tables; without, they are decoded to strings.
+    fn record_batch_to_json(
+        &self,
+        batch: &RecordBatch,
+        labels: Option<&mut DictionaryLabels>,
+    ) -> BlazeResult<Vec<HashMap<String, serde_json::Value>>> {
         let mut result = Vec::with_capacity(batch.num_rows());
         
+        // Translate each dictionary column's batch-local keys once per batch
+        let mut remaps: Vec<Option<Vec<Option<i64>>>> = vec![None; batch.num_columns()];
+        if let Some(labels) = labels {
+            for (col_idx, field) in batch.schema().fields().iter().enumerate() {
+                if let Some(array) = batch.column(col_idx).as_any().downcast_ref::<datafusion::arrow::array::DictionaryArray<datafusion::arrow::datatypes::Int32Type>>() {
+                    if let Some(values) = array.values().as_any().downcast_ref::<datafusion::arrow::array::StringArray>() {
+                        remaps[col_idx] = Some(labels.remap(field.name(), values));
+                    }
+                }
+            }
+        }
+        
         // Simple conversion - can be optimized later
         for row_idx in 0..batch.num_rows() {
             let mut row = HashMap::new();
@@ -268,6 +566,25 @@ impl BlazeQueryEngine {
                             serde_json::Value::String(array.value(row_idx).to_string())
                         }
                     },
+                    datafusion::arrow::datatypes::DataType::Dictionary(key_type, value_type)
+                        if **key_type == datafusion::arrow::datatypes::DataType::Int32
+                            && **value_type == datafusion::arrow::datatypes::DataType::Utf8 =>
+                    {
+                        let array = column.as_any().downcast_ref::<datafusion::arrow::array::DictionaryArray<datafusion::arrow::datatypes::Int32Type>>().unwrap();
+                        if array.is_null(row_idx) {
+                            serde_json::Value::Null
+                        } else if let Some(remap) = &remaps[col_idx] {
+                            // The integer code avoids building a string per row
+                            match remap[array.keys().value(row_idx) as usize] {
+                                Some(code) => serde_json::Value::Number(code.into()),
+                                None => serde_json::Value::Null,
+                            }
+                        } else {
+                            let strings = array.values().as_any().downcast_ref::<datafusion::arrow::array::StringArray>().unwrap();
+                            let key = array.keys().value(row_idx) as usize;
+                            serde_json::Value::String(strings.value(key).to_string())
+                        }
+                    },
                     _ => serde_json::Value::String(format!("Unsupported type: {:?}", field.data_type())),
                 };
                 
@@ -281,7 +598,7 @@ impl BlazeQueryEngine {
     }
 
     /// Update engine statistics
-    async fn update_stats(&self, execution_time_ms: u64, memory_used: u64) {
+    async fn update_stats(&self, execution_time_ms: u64, peak_memory: u64) {
         let mut stats = self.stats.write().await;
         
         stats.total_queries += 1;
@@ -292,8 +609,8 @@ impl BlazeQueryEngine {
         stats.avg_execution_time_ms = total_time / stats.total_queries as f64;
         
         // Update peak memory usage
-        if memory_used > stats.peak_memory_bytes {
-            stats.peak_memory_bytes = memory_used;
+        if peak_memory > stats.peak_memory_bytes {
+            stats.peak_memory_bytes = peak_memory;
         }
     }
 
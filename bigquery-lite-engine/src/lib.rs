@@ -21,7 +21,7 @@ mod python_bindings;
 mod error;
 mod utils;
 
-pub use engine::BlazeQueryEngine;
+pub use engine::{BlazeQueryEngine, ResultData};
 pub use error::{BlazeError, BlazeResult};
 pub use python_bindings::*;
 
@@ -36,6 +36,7 @@ fn bigquery_lite_engine(_py: Python, m: &PyModule) -> PyResult<()> {
 
     // Register classes and functions
     m.add_class::<PyBlazeQueryEngine>()?;
+    m.add_class::<PyPreparedStatement>()?;
     m.add_function(wrap_pyfunction!(create_engine, m)?)?;
     
     Ok(())
@@ -1,29 +1,66 @@
 //! Python FFI bindings for BlazeQueryEngine
 
 use std::collections::HashMap;
+use std::future::Future;
 use std::sync::{Arc, OnceLock};
 
+use datafusion::datasource::MemTable;
+use datafusion::logical_expr::LogicalPlan;
+use parking_lot::Mutex;
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyList};
+use pyo3::types::{PyBytes, PyDict, PyList};
 use tokio::runtime::Runtime;
 
-use crate::engine::{BlazeQueryEngine, QueryResult, EngineStats, EngineConfig};
+use crate::engine::{BlazeQueryEngine, QueryResult, EngineStats, EngineConfig, ResultData};
 use crate::error::{BlazeError, BlazeResult, IntoPyResult};
 
 /// Global shared Tokio runtime for all Python bindings
 static GLOBAL_RUNTIME: OnceLock<Runtime> = OnceLock::new();
 
 /// Get or initialize the global Tokio runtime
+///
+/// Built once per process and shared by every engine, so sync calls never
+/// pay for spawning worker threads; one worker per core matches the
+/// engine's default `target_partitions`.
 fn get_runtime() -> &'static Runtime {
     GLOBAL_RUNTIME.get_or_init(|| {
-        Runtime::new().expect("Failed to create Tokio runtime")
+        tokio::runtime::Builder::new_multi_thread()
+            .worker_threads(num_cpus::get())
+            .thread_name("blaze-runtime")
+            .enable_all()
+            .build()
+            .expect("Failed to create Tokio runtime")
     })
 }
 
+/// Run a future on the global runtime with the GIL released
+///
+/// Other Python threads keep running while DataFusion plans and executes,
+/// so queries submitted from a thread pool execute in parallel.
+fn block_on_released<F>(py: Python<'_>, future: F) -> F::Output
+where
+    F: Future + Send,
+    F::Output: Send,
+{
+    py.allow_threads(|| get_runtime().block_on(future))
+}
+
+/// Maximum number of distinct test data sizes kept in memory per engine
+const TEST_DATA_CACHE_CAPACITY: usize = 8;
+
 /// Python wrapper for BlazeQueryEngine
 #[pyclass(name = "BlazeQueryEngine")]
 pub struct PyBlazeQueryEngine {
     engine: Arc<BlazeQueryEngine>,
+    /// Generated test tables keyed by row count, shared across registrations
+    test_data_cache: Mutex<HashMap<usize, Arc<MemTable>>>,
+}
+
+/// Python wrapper for a query parsed and planned once by `BlazeQueryEngine.prepare`
+#[pyclass(name = "PreparedStatement")]
+pub struct PyPreparedStatement {
+    engine: Arc<BlazeQueryEngine>,
+    plan: LogicalPlan,
 }
 
 /// Python wrapper for QueryResult
@@ -41,6 +78,10 @@ pub struct PyQueryResult {
     // Store data as JSON string for simplicity
     pub data_json: String,
     query_plan: Option<String>,
+    /// Labels for dictionary columns returned as codes (`decode_dict=False`);
+    /// `dictionaries[column][code]` is the value a row's code stands for
+    #[pyo3(get)]
+    pub dictionaries: HashMap<String, Vec<String>>,
 }
 
 /// Python wrapper for EngineStats
@@ -61,48 +102,139 @@ pub struct PyEngineStats {
 impl PyBlazeQueryEngine {
     /// Create a new BlazeQueryEngine instance
     #[new]
-    fn new() -> PyResult<Self> {
+    fn new(py: Python<'_>) -> PyResult<Self> {
         // Use shared global runtime
-        let rt = get_runtime();
-        let engine = rt.block_on(async {
+        let engine = block_on_released(py, async {
             BlazeQueryEngine::new().await.map_err(|e| PyErr::from(e))
         })?;
         
         Ok(PyBlazeQueryEngine {
             engine: Arc::new(engine),
+            test_data_cache: Mutex::new(HashMap::new()),
         })
     }
 
     /// Execute a SQL query synchronously (simplified version)
-    fn execute_query_sync(&self, sql: String) -> PyResult<PyQueryResult> {
-        let rt = get_runtime();
+    ///
+    /// Dictionary-encoded columns (such as the test data `category`) are
+    /// decoded to strings; with `decode_dict=False` they come back as integer
+    /// codes into `result.dictionaries`.
+    #[pyo3(signature = (sql, decode_dict = true))]
+    fn execute_query_sync(&self, py: Python<'_>, sql: String, decode_dict: bool) -> PyResult<PyQueryResult> {
         let engine = self.engine.clone();
         
-        let result = rt.block_on(async move {
-            engine.execute_query(&sql).await.map_err(|e| PyErr::from(e))
+        let result = block_on_released(py, async move {
+            engine.execute_query_as(&sql, row_data(decode_dict)).await.map_err(|e| PyErr::from(e))
         })?;
         
-        // Convert to JSON string for simplicity
-        let data_json = serde_json::to_string(&result.data).map_err(|e| {
-            PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("JSON serialization error: {}", e))
+        PyQueryResult::from_query_result(result)
+    }
+
+    /// Execute a SQL query `n` times without returning to Python between runs
+    ///
+    /// Returns the result of the last run; useful for leak and load tests.
+    #[pyo3(signature = (sql, n, decode_dict = true))]
+    fn execute_query_sync_n(&self, py: Python<'_>, sql: String, n: usize, decode_dict: bool) -> PyResult<PyQueryResult> {
+        if n == 0 {
+            return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>("n must be at least 1"));
+        }
+
+        let engine = self.engine.clone();
+
+        let result = block_on_released(py, async move {
+            let data = row_data(decode_dict);
+            let mut result = engine.execute_query_as(&sql, data).await?;
+            for _ in 1..n {
+                result = engine.execute_query_as(&sql, data).await?;
+            }
+            Ok::<_, BlazeError>(result)
+        }).map_err(|e| PyErr::from(e))?;
+
+        PyQueryResult::from_query_result(result)
+    }
+
+    /// Execute several SQL queries in order in a single call
+    ///
+    /// All queries run inside one runtime block with the GIL released; the
+    /// first failing query raises and the remaining ones are not executed.
+    #[pyo3(signature = (queries, decode_dict = true))]
+    fn execute_many_sync(&self, py: Python<'_>, queries: Vec<String>, decode_dict: bool) -> PyResult<Vec<PyQueryResult>> {
+        let engine = self.engine.clone();
+
+        let results = block_on_released(py, async move {
+            let mut results = Vec::with_capacity(queries.len());
+            for sql in &queries {
+                results.push(engine.execute_query_as(sql, row_data(decode_dict)).await?);
+            }
+            Ok::<_, BlazeError>(results)
+        }).map_err(|e| PyErr::from(e))?;
+
+        results.into_iter().map(PyQueryResult::from_query_result).collect()
+    }
+
+    /// Execute a SQL query synchronously, returning row count and metrics only
+    ///
+    /// Skips result conversion entirely; the returned `data` is always empty.
+    fn execute_query_sync_meta(&self, py: Python<'_>, sql: String) -> PyResult<PyQueryResult> {
+        let engine = self.engine.clone();
+
+        let result = block_on_released(py, async move {
+            engine.execute_query_meta(&sql).await.map_err(|e| PyErr::from(e))
         })?;
-        
+
         Ok(PyQueryResult {
             rows: result.rows,
             execution_time_ms: result.execution_time_ms,
             memory_used_bytes: result.memory_used_bytes,
             engine: result.engine,
-            data_json,
+            data_json: "[]".to_string(),
             query_plan: result.query_plan,
+            dictionaries: HashMap::new(),
         })
     }
 
+    /// Execute a SQL query and return the result as a `pyarrow.Table`
+    ///
+    /// Batches cross the FFI boundary as one Arrow IPC stream, so the cost is
+    /// per column buffer rather than one Python dict per row.
+    fn execute_query_arrow(&self, py: Python<'_>, sql: String) -> PyResult<PyObject> {
+        let engine = self.engine.clone();
+
+        let ipc = block_on_released(py, async move {
+            let (_, schema, batches) = engine.execute_query_batches(&sql).await?;
+            batches_to_ipc(&schema, &batches)
+        }).map_err(|e| PyErr::from(e))?;
+
+        let reader = py
+            .import("pyarrow.ipc")?
+            .call_method1("open_stream", (PyBytes::new(py, &ipc),))?;
+        Ok(reader.call_method0("read_all")?.into())
+    }
+
+    /// Parse and plan a SQL query for repeated execution
+    fn prepare(&self, py: Python<'_>, sql: String) -> PyResult<PyPreparedStatement> {
+        let engine = self.engine.clone();
+
+        let plan = block_on_released(py, async move {
+            engine.prepare(&sql).await.map_err(|e| PyErr::from(e))
+        })?;
+
+        Ok(PyPreparedStatement {
+            engine: self.engine.clone(),
+            plan,
+        })
+    }
+
+    /// Peak bytes DataFusion reserved during the last finished query
+    fn get_last_peak_bytes(&self) -> u64 {
+        self.engine.last_peak_bytes()
+    }
+
     /// Get engine statistics synchronously
-    fn get_stats_sync(&self) -> PyResult<PyEngineStats> {
-        let rt = get_runtime();
+    fn get_stats_sync(&self, py: Python<'_>) -> PyResult<PyEngineStats> {
         let engine = self.engine.clone();
         
-        let stats = rt.block_on(async move {
+        let stats = block_on_released(py, async move {
             engine.get_stats().await
         });
         
@@ -115,11 +247,10 @@ impl PyBlazeQueryEngine {
     }
 
     /// List available tables synchronously
-    fn list_tables_sync(&self) -> PyResult<Vec<String>> {
-        let rt = get_runtime();
+    fn list_tables_sync(&self, py: Python<'_>) -> PyResult<Vec<String>> {
         let engine = self.engine.clone();
         
-        let tables = rt.block_on(async move {
+        let tables = block_on_released(py, async move {
             engine.list_tables().await.map_err(|e| PyErr::from(e))
         })?;
         
@@ -127,29 +258,149 @@ impl PyBlazeQueryEngine {
     }
 
     /// Validate SQL query syntax synchronously
-    fn validate_query_sync(&self, sql: String) -> PyResult<bool> {
-        let rt = get_runtime();
+    fn validate_query_sync(&self, py: Python<'_>, sql: String) -> PyResult<bool> {
         let engine = self.engine.clone();
         
-        let is_valid = rt.block_on(async move {
+        let is_valid = block_on_released(py, async move {
             engine.validate_query(&sql).await.map_err(|e| PyErr::from(e))
         })?;
         
         Ok(is_valid)
     }
 
+    /// Return the optimized logical and physical plans for a query, without executing it
+    fn explain_sync(&self, py: Python<'_>, sql: String) -> PyResult<String> {
+        let engine = self.engine.clone();
+
+        let plan = block_on_released(py, async move {
+            engine.explain(&sql).await.map_err(|e| PyErr::from(e))
+        })?;
+
+        Ok(plan)
+    }
+
     /// Register test data for benchmarking
-    fn register_test_data(&self, table_name: String, rows: usize) -> PyResult<()> {
-        let rt = get_runtime();
+    fn register_test_data(&self, py: Python<'_>, table_name: String, rows: usize) -> PyResult<()> {
+        self.register_test_data_batch(py, vec![table_name], rows)
+    }
+
+    /// Register one set of test data under several table names in a single call
+    ///
+    /// All names registered at the same `rows` share one cached table, so
+    /// writes through one name are visible under the others.
+    fn register_test_data_batch(&self, py: Python<'_>, table_names: Vec<String>, rows: usize) -> PyResult<()> {
         let engine = self.engine.clone();
-        
-        rt.block_on(async move {
-            let batches = create_test_data(rows).await.map_err(|e| PyErr::from(e))?;
-            engine.register_table(&table_name, batches).await.map_err(|e| PyErr::from(e))
+
+        block_on_released(py, async move {
+            let table = self.cached_test_table(rows).await.map_err(|e| PyErr::from(e))?;
+            engine.register_mem_table(&table_names, table).await.map_err(|e| PyErr::from(e))
         })?;
-        
+
         Ok(())
     }
+
+    /// Count the rows of a registered table synchronously (no SQL round trip)
+    fn count_table(&self, py: Python<'_>, table_name: String) -> PyResult<usize> {
+        let engine = self.engine.clone();
+
+        let count = block_on_released(py, async move {
+            engine.count_rows(&table_name).await.map_err(|e| PyErr::from(e))
+        })?;
+
+        Ok(count)
+    }
+
+    /// Deregister a table, returning True if it was registered
+    fn deregister_table(&self, py: Python<'_>, table_name: String) -> PyResult<bool> {
+        let engine = self.engine.clone();
+
+        let removed = block_on_released(py, async move {
+            engine.deregister_table(&table_name).await.map_err(|e| PyErr::from(e))
+        })?;
+
+        Ok(removed)
+    }
+}
+
+impl PyBlazeQueryEngine {
+    /// Get the test table for `rows`, generating it only on a cache miss
+    ///
+    /// Tables of the same size share one `MemTable`, so repeated
+    /// registrations are a pointer copy instead of fresh Arrow allocations.
+    /// The table is not read-only: every name registered at this row count
+    /// aliases the same `Arc`, so an `INSERT INTO` through one name shows up
+    /// under all of them and in later registrations. Test data that will be
+    /// written to needs its own table via `BlazeQueryEngine::register_table`.
+    async fn cached_test_table(&self, rows: usize) -> BlazeResult<Arc<MemTable>> {
+        let cached = self.test_data_cache.lock().get(&rows).cloned();
+        if let Some(table) = cached {
+            return Ok(table);
+        }
+
+        let batches = create_test_data(rows).await?;
+        if batches.is_empty() {
+            return Err(BlazeError::InvalidInput("Cannot register empty table".to_string()));
+        }
+        let schema = batches[0].schema();
+        let partitions = split_partitions(batches, self.engine.target_partitions());
+        let table = Arc::new(MemTable::try_new(schema, partitions)?);
+
+        let mut cache = self.test_data_cache.lock();
+        if cache.len() >= TEST_DATA_CACHE_CAPACITY {
+            cache.clear();
+        }
+        Ok(cache.entry(rows).or_insert(table).clone())
+    }
+}
+
+#[pymethods]
+impl PyPreparedStatement {
+    /// Execute the prepared query synchronously (dictionary codes with `decode_dict=False`)
+    #[pyo3(signature = (decode_dict = true))]
+    fn execute(&self, py: Python<'_>, decode_dict: bool) -> PyResult<PyQueryResult> {
+        let result = block_on_released(py, async {
+            self.engine.execute_prepared(&self.plan, row_data(decode_dict)).await.map_err(|e| PyErr::from(e))
+        })?;
+
+        PyQueryResult::from_query_result(result)
+    }
+
+    /// Execute the prepared query synchronously, returning row count and metrics only
+    fn execute_meta(&self, py: Python<'_>) -> PyResult<PyQueryResult> {
+        let result = block_on_released(py, async {
+            self.engine.execute_prepared(&self.plan, ResultData::RowCount).await.map_err(|e| PyErr::from(e))
+        })?;
+
+        Ok(PyQueryResult {
+            rows: result.rows,
+            execution_time_ms: result.execution_time_ms,
+            memory_used_bytes: result.memory_used_bytes,
+            engine: result.engine,
+            data_json: "[]".to_string(),
+            query_plan: result.query_plan,
+            dictionaries: HashMap::new(),
+        })
+    }
+}
+
+impl PyQueryResult {
+    /// Wrap an engine result, serializing its rows to JSON
+    fn from_query_result(result: QueryResult) -> PyResult<Self> {
+        // Convert to JSON string for simplicity
+        let data_json = serde_json::to_string(&result.data).map_err(|e| {
+            PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("JSON serialization error: {}", e))
+        })?;
+
+        Ok(PyQueryResult {
+            rows: result.rows,
+            execution_time_ms: result.execution_time_ms,
+            memory_used_bytes: result.memory_used_bytes,
+            engine: result.engine,
+            data_json,
+            query_plan: result.query_plan,
+            dictionaries: result.dictionaries,
+        })
+    }
 }
 
 #[pymethods]
@@ -207,8 +458,8 @@ impl PyEngineStats {
 
 /// Create a new engine instance (convenience function)
 #[pyfunction]
-pub fn create_engine() -> PyResult<PyBlazeQueryEngine> {
-    PyBlazeQueryEngine::new()
+pub fn create_engine(py: Python<'_>) -> PyResult<PyBlazeQueryEngine> {
+    PyBlazeQueryEngine::new(py)
 }
 
 /// Helper function to convert serde_json::Value to Python object
@@ -243,12 +494,51 @@ fn json_value_to_python(py: Python, value: &serde_json::Value) -> PyResult<PyObj
     }
 }
 
+/// Result conversion for the Python `decode_dict` flag
+fn row_data(decode_dict: bool) -> ResultData {
+    if decode_dict {
+        ResultData::Decoded
+    } else {
+        ResultData::DictCodes
+    }
+}
+
+/// Serialize record batches as an Arrow IPC stream
+fn batches_to_ipc(
+    schema: &datafusion::arrow::datatypes::SchemaRef,
+    batches: &[datafusion::arrow::record_batch::RecordBatch],
+) -> BlazeResult<Vec<u8>> {
+    use datafusion::arrow::ipc::writer::StreamWriter;
+
+    let mut writer = StreamWriter::try_new(Vec::new(), schema)?;
+    for batch in batches {
+        writer.write(batch)?;
+    }
+    Ok(writer.into_inner()?)
+}
+
+/// Deal batches round-robin into at most `partitions` MemTable partitions
+///
+/// One partition per target partition lets the scan and the partial
+/// aggregate run on every core before the final merge.
+fn split_partitions(
+    batches: Vec<datafusion::arrow::record_batch::RecordBatch>,
+    partitions: usize,
+) -> Vec<Vec<datafusion::arrow::record_batch::RecordBatch>> {
+    let count = partitions.clamp(1, batches.len().max(1));
+    let mut split = vec![Vec::new(); count];
+    for (i, batch) in batches.into_iter().enumerate() {
+        split[i % count].push(batch);
+    }
+    split
+}
+
 /// Create test data for benchmarking
 async fn create_test_data(
     rows: usize
 ) -> BlazeResult<Vec<datafusion::arrow::record_batch::RecordBatch>> {
     use datafusion::arrow::array::*;
-    use datafusion::arrow::datatypes::{Schema, Field, DataType};
+    use datafusion::arrow::datatypes::{Schema, Field, DataType, Int32Type};
     use std::sync::Arc;
     use rand::Rng;
 
@@ -257,10 +547,22 @@ async fn create_test_data(
     let schema = Arc::new(Schema::new(vec![
         Field::new("id", DataType::Int64, false),
         Field::new("value", DataType::Float64, false),
-        Field::new("category", DataType::Utf8, false),
+        Field::new(
+            "category",
+            DataType::Dictionary(Box::new(DataType::Int32), Box::new(DataType::Utf8)),
+            false,
+        ),
     ]));
 
-    let batch_size = 10_000;
+    // Category is dictionary-encoded: every batch shares the 10 strings and
+    // stores 4-byte keys, which GROUP BY hashes instead of the strings
+    let category_values: ArrayRef = Arc::new(StringArray::from_iter_values(
+        (0..10).map(|i| format!("category_{}", i))
+    ));
+
+    // 64K rows keeps each Int64/Float64 column chunk at ~512KB, so batches stay
+    // cache-friendly while giving every partition several batches to scan
+    let batch_size = 65_536;
     let mut batches = Vec::new();
 
     for batch_start in (0..rows).step_by(batch_size) {
@@ -274,9 +576,13 @@ async fn create_test_data(
             (0..batch_rows).map(|_| rng.gen_range(0.0..1000.0))
         );
         
-        let category_array = StringArray::from_iter_values(
-            (0..batch_rows).map(|i| format!("category_{}", (batch_start + i) % 10))
+        let category_keys = Int32Array::from_iter_values(
+            (0..batch_rows).map(|i| ((batch_start + i) % 10) as i32)
         );
+        let category_array = DictionaryArray::<Int32Type>::try_new(
+            category_keys,
+            category_values.clone(),
+        )?;
 
         let batch = datafusion::arrow::record_batch::RecordBatch::try_new(
             schema.clone(),
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """BigQuery-Lite CLI tool."""
 
+import atexit
 import json
 import os
 from pathlib import Path
@@ -23,12 +24,34 @@ console = Console()
 # Default backend URL
 DEFAULT_BACKEND_URL = "http://localhost:8002"
 
+# Request timeouts in seconds; ingestion uploads get a longer one
+DEFAULT_TIMEOUT = 30.0
+INGEST_TIMEOUT = 300.0
+
+# Shared HTTP client so commands reuse keep-alive connections to the backend
+_client: Optional[httpx.Client] = None
+
 
 def get_backend_url() -> str:
     """Get backend URL from environment or use default."""
     return os.getenv("BQLITE_BACKEND_URL", DEFAULT_BACKEND_URL)
 
 
+def get_client() -> httpx.Client:
+    """Get the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.Client(
+            timeout=DEFAULT_TIMEOUT,
+            transport=httpx.HTTPTransport(
+                retries=1,
+                limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+            ),
+        )
+        atexit.register(_client.close)
+    return _client
+
+
 def handle_http_error(response: httpx.Response) -> None:
     """Handle HTTP errors with user-friendly messages."""
     if response.status_code == 404:
@@ -66,19 +89,19 @@ def register_schema(
         raise typer.Exit(1)
     
     try:
-        with httpx.Client(timeout=30.0) as client:
-            with open(proto_file, "rb") as f:
-                files = {"proto_file": (proto_file.name, f, "text/plain")}
-                data = {
-                    "table_name": table,
-                    "database_name": database
-                }
-                
-                response = client.post(
-                    f"{backend_url}/schemas/register",
-                    files=files,
-                    data=data
-                )
+        client = get_client()
+        with open(proto_file, "rb") as f:
+            files = {"proto_file": (proto_file.name, f, "text/plain")}
+            data = {
+                "table_name": table,
+                "database_name": database
+            }
+            
+            response = client.post(
+                f"{backend_url}/schemas/register",
+                files=files,
+                data=data
+            )
         
         if response.status_code == 200:
             result = response.json()
@@ -123,8 +146,8 @@ def create_table(
     
     try:
         # First, find the schema ID for the given table
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(f"{backend_url}/schemas")
+        client = get_client()
+        response = client.get(f"{backend_url}/schemas")
             
         if response.status_code != 200:
             handle_http_error(response)
@@ -145,17 +168,16 @@ def create_table(
         schema_id = matching_schema["schema_id"]
         
         # Create tables
-        with httpx.Client(timeout=30.0) as client:
-            request_data = {
-                "engines": engine_list,
-                "if_not_exists": if_not_exists,
-                "create_flattened_view": flattened_view
-            }
-            
-            response = client.post(
-                f"{backend_url}/schemas/{schema_id}/tables/create",
-                json=request_data
-            )
+        request_data = {
+            "engines": engine_list,
+            "if_not_exists": if_not_exists,
+            "create_flattened_view": flattened_view
+        }
+        
+        response = client.post(
+            f"{backend_url}/schemas/{schema_id}/tables/create",
+            json=request_data
+        )
         
         if response.status_code == 200:
             result = response.json()
@@ -217,8 +239,8 @@ def ingest_data(
     
     try:
         # Find schema ID
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(f"{backend_url}/schemas")
+        client = get_client()
+        response = client.get(f"{backend_url}/schemas")
             
         if response.status_code != 200:
             handle_http_error(response)
@@ -238,21 +260,23 @@ def ingest_data(
         schema_id = matching_schema["schema_id"]
         
         # Ingest data
-        with httpx.Client(timeout=300.0) as client:  # Longer timeout for data ingestion
-            with open(data_file, "rb") as f:
-                files = {"pb_file": (data_file.name, f, "application/octet-stream")}
-                data = {
-                    "target_engine": engine,
-                    "batch_size": batch_size,
-                    "create_table_if_not_exists": create_table
-                }
-                
-                rprint(f"[blue]🔄 Ingesting data from {data_file.name}...[/blue]")
-                response = client.post(
-                    f"{backend_url}/schemas/{schema_id}/ingest",
-                    files=files,
-                    data=data
-                )
+        with open(data_file, "rb") as f:
+            # httpx streams file objects in chunks (length taken from fstat),
+            # so the .pb file is never read fully into memory
+            files = {"pb_file": (data_file.name, f, "application/octet-stream")}
+            data = {
+                "target_engine": engine,
+                "batch_size": batch_size,
+                "create_table_if_not_exists": create_table
+            }
+            
+            rprint(f"[blue]🔄 Ingesting data from {data_file.name}...[/blue]")
+            response = client.post(
+                f"{backend_url}/schemas/{schema_id}/ingest",
+                files=files,
+                data=data,
+                timeout=INGEST_TIMEOUT
+            )
         
         if response.status_code == 200:
             result = response.json()
@@ -294,8 +318,8 @@ def list_schemas(
     backend_url = backend_url or get_backend_url()
     
     try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(f"{backend_url}/schemas")
+        client = get_client()
+        response = client.get(f"{backend_url}/schemas")
         
         if response.status_code == 200:
             result = response.json()